@@ -0,0 +1,77 @@
+"""
+Tests for the archived v1 pool scraper's text extractors: the single-pass
+metadata extractor against the per-field extractors, and time correction.
+Run with: pytest tests/test_legacy_pool_meta.py -v
+"""
+import sys
+import os
+import random
+
+import pytest
+
+pytest.importorskip("playwright")
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'archived-versions', 'v1-legacy'
+))
+
+from vbl_pool_scraper import VBLPoolScraper
+
+
+# Fragments that make court, match-number and time patterns overlap
+TOKENS = [
+    'Court', 'Ct', 'Match', 'Game', '#', 'court ', ':', ' ', '1', '10', '18',
+    ':00', '30', 'AM', 'PM', 'am', '9', 'Foo', 'A', ' #', '12', ':3',
+]
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    return VBLPoolScraper()
+
+
+def per_field(scraper, text):
+    return (
+        scraper.extract_time_from_text(text),
+        scraper.extract_court_from_text(text),
+        scraper.extract_match_number_from_text(text),
+    )
+
+
+class TestExtractMetaFromText:
+    """extract_meta_from_text must agree with the extract_*_from_text methods."""
+
+    @pytest.mark.parametrize("text", [
+        "Game 10:30AM",
+        "Court 10:30AM",
+        "1FooCt9AM",
+        "Match 18:00AMCourt 2",
+        "Match 3 Court 4 9:00AM",
+        "Court A Match #12 2PM",
+        "14:15 Ct: 7",
+        "",
+    ])
+    def test_overlapping_fields(self, scraper, text):
+        assert scraper.extract_meta_from_text(text) == per_field(scraper, text)
+
+    def test_random_token_strings(self, scraper):
+        rnd = random.Random(1)
+        for _ in range(5000):
+            text = ''.join(rnd.choice(TOKENS) for _ in range(rnd.randint(1, 12)))
+            assert scraper.extract_meta_from_text(text) == per_field(scraper, text), text
+
+
+class TestFixTime:
+    """fix_time corrects corrupted AM/PM hours and leaves 24-hour times alone."""
+
+    @pytest.mark.parametrize("raw, fixed", [
+        ("18:00AM", "8:00AM"),
+        ("28:30pm", "8:30PM"),
+        ("20:00PM", "12:00PM"),
+        ("10:30AM", "10:30AM"),
+        ("9AM", "9AM"),
+        ("14:15", "14:15"),
+        ("18:00", "18:00"),
+    ])
+    def test_fix_time(self, scraper, raw, fixed):
+        assert scraper.fix_time(raw) == fixed
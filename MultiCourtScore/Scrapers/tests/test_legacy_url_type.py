@@ -0,0 +1,40 @@
+"""
+Tests for URL classification in the archived v1 complete-login script.
+Run with: pytest tests/test_legacy_url_type.py -v
+"""
+import sys
+import os
+
+import pytest
+
+pytest.importorskip("playwright")
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'archived-versions', 'v1-legacy'
+))
+
+from vbl_complete_login import VBLCompleteLogin
+
+
+BASE = 'https://volleyballlife.com/event/27644/division/104314'
+
+
+class TestDetermineUrlType:
+    """determine_url_type keeps the pools-first, match-anywhere behavior."""
+
+    @pytest.mark.parametrize("url, expected", [
+        (f'{BASE}/round/228002/pools/277767', ("Pool Play", "Pool 277767")),
+        (f'{BASE}/round/228002/POOLS/277767', ("Pool Play", "Pool 277767")),
+        (f'{BASE}/round/228002/pools/', ("Pool Play", "Pool Unknown")),
+        (f'{BASE}/round/1/brackets/2/pools/3', ("Pool Play", "Pool 3")),
+        (f'{BASE}/round/1/pools/x/brackets/winners', ("Pool Play", "Pool Unknown")),
+        (f'{BASE}/round/228003/brackets/', ("Bracket Play", "Main Bracket")),
+        (f'{BASE}/round/228003/brackets/winners', ("Bracket Play", "Winners Bracket")),
+        (f'{BASE}/round/228003/Brackets/Contenders', ("Bracket Play", "Contenders Bracket")),
+        (f'{BASE}/round/228003/brackets/winners?view=contenders', ("Bracket Play", "Contenders Bracket")),
+        ('https://volleyballlife.com/event/1/winners/brackets/', ("Bracket Play", "Winners Bracket")),
+        (f'{BASE}/teams', ("Bracket Play", "Main Bracket")),
+        (f'{BASE}/winners', ("Bracket Play", "Main Bracket")),
+    ])
+    def test_url_shapes(self, url, expected):
+        assert VBLCompleteLogin().determine_url_type(url) == expected
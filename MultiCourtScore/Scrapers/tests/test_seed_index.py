@@ -0,0 +1,96 @@
+"""
+Tests for the archived v2 CLI's seed lookup: the Aho-Corasick path and the
+pure-Python fallback must return the same first-in-table-order seed.
+Run with: pytest tests/test_seed_index.py -v
+"""
+import sys
+import os
+import random
+
+import pytest
+
+pytest.importorskip("playwright")
+
+V2_SCRAPERS = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'archived-versions', 'v2-refactored', 'Scrapers'
+)
+
+
+def _import_v2_cli():
+    """
+    Import the archived vbl_scraper.cli without clobbering the live
+    vbl_scraper package, which shares its name.
+    """
+    live = {name: mod for name, mod in sys.modules.items()
+            if name == 'vbl_scraper' or name.startswith('vbl_scraper.')}
+    for name in live:
+        del sys.modules[name]
+    sys.path.insert(0, V2_SCRAPERS)
+    try:
+        import vbl_scraper.cli as v2_cli
+    finally:
+        sys.path.remove(V2_SCRAPERS)
+        for name in [n for n in sys.modules if n == 'vbl_scraper' or n.startswith('vbl_scraper.')]:
+            del sys.modules[name]
+        sys.modules.update(live)
+    return v2_cli
+
+
+cli = _import_v2_cli()
+
+# Table order matters: earlier rows win when several seeds match
+SEEDS = {
+    'Smith / Jones': '1',
+    'Anna Lee / Beth Park': '2',
+    'Lee': '3',
+    'SMITH / JONES': '4',
+    'Chris  Day / Dana Fox': '5',
+    'Park': '6',
+}
+
+
+@pytest.fixture(params=['fallback', 'automaton'])
+def build_index(request, monkeypatch):
+    if request.param == 'automaton':
+        pytest.importorskip("ahocorasick")
+        monkeypatch.setattr(cli, 'AHOCORASICK_AVAILABLE', True)
+    else:
+        monkeypatch.setattr(cli, 'AHOCORASICK_AVAILABLE', False)
+    return cli._build_seed_index
+
+
+class TestFindSeed:
+    """_find_seed returns the same seed with and without ahocorasick."""
+
+    def test_empty_seeds(self, build_index):
+        assert build_index({}) is None
+        assert cli._find_seed('Smith / Jones', None) is None
+
+    @pytest.mark.parametrize("team, seed", [
+        ('Smith / Jones', '1'),             # exact
+        ('Chris Day / Dana Fox', '5'),      # whitespace-normalized
+        ('smith / jones', '1'),             # case-insensitive, first row wins
+        ('Beth Park', '2'),                 # team inside an earlier seed
+        ('Zoe Park / Amy Lee', '3'),        # first seed inside the team
+        ('Anna', '2'),                      # reverse containment only
+        ('Nobody / Atall', None),
+        ('', None),
+    ])
+    def test_lookup(self, build_index, team, seed):
+        assert cli._find_seed(team, build_index(SEEDS)) == seed
+
+    def test_matches_fallback_on_random_names(self, build_index, monkeypatch):
+        rnd = random.Random(7)
+        words = ['lee', 'Park', 'ann', 'a', 'Smith', '/', 'jones', 'Day', 'fox', 'x']
+        for _ in range(200):
+            seeds = {
+                ' '.join(rnd.choice(words) for _ in range(rnd.randint(1, 3))): str(n)
+                for n in range(rnd.randint(1, 6))
+            }
+            index = build_index(seeds)
+            with monkeypatch.context() as m:
+                m.setattr(cli, 'AHOCORASICK_AVAILABLE', False)
+                reference = cli._build_seed_index(seeds)
+            for _ in range(20):
+                team = ' '.join(rnd.choice(words) for _ in range(rnd.randint(1, 4)))
+                assert cli._find_seed(team, index) == cli._find_seed(team, reference), (team, seeds)
@@ -14,7 +14,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
-# Configure logging
+# Configure logging; basicConfig does nothing if the importing application
+# has already configured the root logger
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
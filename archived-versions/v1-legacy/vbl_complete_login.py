@@ -5,7 +5,9 @@ Follows the exact four-phase login workflow from screenshot analysis
 """
 
 import asyncio
+import copy
 import json
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -13,32 +15,92 @@ from typing import Optional
 
 from vbl_precise_scraper import VBLPreciseScraper
 
+# orjson encodes the results file much faster; fall back to json if missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# URL shape checks, all case-insensitive so the URL is never lowered.
+# Pools take precedence over brackets wherever each appears, and a named
+# bracket counts anywhere in the URL, contenders before winners
+POOL_SEGMENT_RE = re.compile(r'/pools/', re.IGNORECASE)
+POOL_ID_RE = re.compile(r'/pools/(\d+)', re.IGNORECASE)
+BRACKET_SEGMENT_RE = re.compile(r'/brackets/', re.IGNORECASE)
+BRACKET_NAME_RE = re.compile(r'contenders|winners', re.IGNORECASE)
+BRACKET_DETAILS = {
+    'contenders': "Contenders Bracket",
+    'winners': "Winners Bracket",
+}
+
+# First rendered match card on a bracket page
+BRACKET_READY_SELECTOR = 'div.div-match-card, .match-card, div[class*="match-card"]'
+
+# Final Sign In button inside the login modal
+MODAL_SIGNIN_SELECTOR = 'div.v-card button:has-text("Sign In")'
+
 
 class VBLCompleteLogin(VBLPreciseScraper):
     """Complete login system following four-phase workflow"""
     
+    # Indicator selectors joined into one list each so a single query
+    # answers "is any of them visible"
+    SIGN_IN_SELECTOR = ', '.join(
+        f'{selector}:visible' for selector in (
+            'button:has-text("Sign In")',
+            'a:has-text("Sign In")',
+            '[class*="sign-in"]'
+        )
+    )
+    PROFILE_SELECTOR = ', '.join(
+        f'{selector}:visible' for selector in (
+            '[class*="profile"]',
+            '[class*="avatar"]',
+            'button:has-text("Logout")',
+            'a:has-text("Profile")'
+        )
+    )
+    
+    # Email field candidates within the login modal
+    EMAIL_SELECTORS = (
+        'div.v-card input[type="text"]',  # Email field within the modal
+        'input[aria-label="Email"]',
+        'input[placeholder*="email"]',
+        'div[class*="modal"] input[type="text"]',
+        'div[class*="dialog"] input[type="text"]'
+    )
+    
+    # Final sign-in button candidates, most specific first
+    FINAL_SIGNIN_SELECTORS = (
+        MODAL_SIGNIN_SELECTOR,  # Within the modal card
+        'button[type="submit"]:has-text("Sign In")',  # Submit button variant
+        'button:has-text("Sign In"):not(:disabled)',  # Enabled sign-in button
+        'form button:has-text("Sign In")',  # Within a form
+        'button:has-text("Sign In")'  # Fallback
+    )
+    
+    # Email selector that matched on the last login, tried first next time
+    preferred_email_selector: Optional[str] = None
+    
     def determine_url_type(self, url: str):
         """
         Determine match type and additional info from URL
         Returns: (match_type, additional_info)
         """
-        url_lower = url.lower()
-        
-        if '/pools/' in url_lower:
+        if POOL_SEGMENT_RE.search(url):
             # Extract pool number from URL if possible
-            import re
-            pool_match = re.search(r'/pools/(\d+)', url_lower)
+            pool_match = POOL_ID_RE.search(url)
             pool_num = pool_match.group(1) if pool_match else "Unknown"
             return "Pool Play", f"Pool {pool_num}"
-        elif '/brackets/' in url_lower:
-            if 'contenders' in url_lower:
-                return "Bracket Play", "Contenders Bracket"
-            elif 'winners' in url_lower:
-                return "Bracket Play", "Winners Bracket"
-            else:
-                return "Bracket Play", "Main Bracket"
-        else:
-            return "Bracket Play", "Main Bracket"
+        
+        if BRACKET_SEGMENT_RE.search(url):
+            names = {name.lower() for name in BRACKET_NAME_RE.findall(url)}
+            for name, detail in BRACKET_DETAILS.items():
+                if name in names:
+                    return "Bracket Play", detail
+        
+        return "Bracket Play", "Main Bracket"
     
     async def complete_login_and_scan(self, bracket_url: str, username: str = None, password: str = None) -> dict:
         """
@@ -53,53 +115,42 @@ class VBLCompleteLogin(VBLPreciseScraper):
             match_type, type_detail = self.determine_url_type(bracket_url)
             print(f"📋 Detected: {match_type} - {type_detail}")
             
-            # Always start with initial setup and V3 switching
-            await self.phase_1_initial_setup()
-            
-            # Check current login status using session
-            login_needed = not await self.check_login_status()
+            # A restored session goes straight to the bracket; setup and
+            # login only run if the bracket still shows a Sign In indicator
+            login_needed = False
+            on_bracket = False
+            if self.session_file.exists():
+                print("🔑 Saved session found - opening bracket directly...")
+                await self.page.goto(bracket_url)
+                await self.page.wait_for_load_state('networkidle')
+                on_bracket = not await self.page.locator(self.SIGN_IN_SELECTOR).count()
+                if on_bracket:
+                    print("✅ Saved session still valid - skipping setup and login")
             
-            if login_needed and username and password:
-                print("🔐 Login required - starting login process...")
-                login_success = await self.four_phase_login(username, password)
+            if not on_bracket:
+                await self.phase_1_initial_setup()
                 
-                if not login_success:
-                    print("❌ Login failed - proceeding without authentication")
-            elif login_needed:
-                print("⚠️ Login required but no credentials provided")
-            else:
-                print("✅ Already logged in or login not required")
-            
-            # Now proceed with bracket scanning
-            print(f"\n🎯 Starting bracket scan...")
-            await self.page.goto(bracket_url)
-            await self.page.wait_for_load_state('networkidle')
-            
-            # Wait 4.2 seconds before interacting with bracket to ensure page is fully loaded
-            print("⏳ Waiting 4.2 seconds for bracket page to fully load...")
-            await asyncio.sleep(4.2)
-            print("✅ Page load delay complete - proceeding with bracket scanning")
-            
-            # Execute three-phase bracket scanning
-            matches_data = await self.execute_three_phases()
+                # Check current login status using session
+                login_needed = not await self.check_login_status()
+                
+                if login_needed and username and password:
+                    print("🔐 Login required - starting login process...")
+                    login_success = await self.four_phase_login(username, password)
+                    
+                    if not login_success:
+                        print("❌ Login failed - proceeding without authentication")
+                elif login_needed:
+                    print("⚠️ Login required but no credentials provided")
+                else:
+                    print("✅ Already logged in or login not required")
+                
+                await self.page.goto(bracket_url)
+                await self.page.wait_for_load_state('networkidle')
             
-            # Add match type information to each match
-            for match in matches_data:
-                match['match_type'] = match_type
-                match['type_detail'] = type_detail
+            result = await self.scan_bracket_page(bracket_url, navigate=False)
+            result['login_performed'] = login_needed and username and password
             
-            result = {
-                'url': bracket_url,
-                'timestamp': datetime.now().isoformat(),
-                'total_matches': len(matches_data),
-                'matches': matches_data,
-                'match_type': match_type,
-                'type_detail': type_detail,
-                'login_performed': login_needed and username and password,
-                'status': 'success' if matches_data else 'no_matches'
-            }
-            
-            print(f"✅ Complete workflow finished - extracted {len(matches_data)} matches")
+            print(f"✅ Complete workflow finished - extracted {result['total_matches']} matches")
             return result
             
         except Exception as e:
@@ -111,6 +162,85 @@ class VBLCompleteLogin(VBLPreciseScraper):
                 'status': 'error'
             }
     
+    async def scan_bracket_page(self, bracket_url: str, navigate: bool = True) -> dict:
+        """
+        Scan one bracket on this scraper's page, with no setup or login.
+        Raises on failure; callers turn errors into result dicts
+        """
+        match_type, type_detail = self.determine_url_type(bracket_url)
+        
+        if navigate:
+            await self.page.goto(bracket_url)
+            await self.page.wait_for_load_state('networkidle')
+        
+        # Now proceed with bracket scanning
+        print(f"\n🎯 Starting bracket scan...")
+        
+        # Wait for the first match card before interacting with the bracket
+        print("⏳ Waiting for bracket matches to render...")
+        try:
+            await self.page.wait_for_selector(BRACKET_READY_SELECTOR, timeout=8000)
+            print("✅ Bracket rendered - proceeding with bracket scanning")
+        except Exception:
+            print("⚠️ No match cards rendered yet - scanning the page as is")
+        
+        # Execute three-phase bracket scanning
+        matches_data = await self.execute_three_phases()
+        
+        # Add match type information to each match
+        for match in matches_data:
+            match['match_type'] = match_type
+            match['type_detail'] = type_detail
+        
+        return {
+            'url': bracket_url,
+            'timestamp': datetime.now().isoformat(),
+            'total_matches': len(matches_data),
+            'matches': matches_data,
+            'match_type': match_type,
+            'type_detail': type_detail,
+            'login_performed': False,
+            'status': 'success' if matches_data else 'no_matches'
+        }
+    
+    async def scan_many(self, bracket_urls: list, username: str = None, password: str = None,
+                        concurrency: int = 4) -> list:
+        """
+        Scan several bracket URLs in one browser session.
+        The first URL runs the full workflow on the main page, so setup and
+        login happen once; the rest only navigate and scan, in parallel tabs
+        that share the logged-in context.
+        Returns results in the same order as bracket_urls
+        """
+        if not bracket_urls:
+            return []
+        
+        first = await self.complete_login_and_scan(bracket_urls[0], username, password)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def scan_in_tab(bracket_url: str) -> dict:
+            async with semaphore:
+                page = await self.context.new_page()
+                page.set_default_timeout(self.timeout)
+                # Shallow copy shares browser and context, only the page differs
+                tab = copy.copy(self)
+                tab.page = page
+                try:
+                    return await tab.scan_bracket_page(bracket_url)
+                except Exception as e:
+                    print(f"❌ Error scanning {bracket_url}: {e}")
+                    return {
+                        'url': bracket_url,
+                        'timestamp': datetime.now().isoformat(),
+                        'error': str(e),
+                        'status': 'error'
+                    }
+                finally:
+                    await page.close()
+        
+        rest = await asyncio.gather(*(scan_in_tab(url) for url in bracket_urls[1:]))
+        return [first, *rest]
+    
     async def phase_1_initial_setup(self):
         """
         Phase 1: Initial Page Setup and View Switching
@@ -139,7 +269,7 @@ class VBLCompleteLogin(VBLPreciseScraper):
                 # Step 3: Wait for navigation after clicking
                 print("⏳ Step 3: Waiting for navigation to complete...")
                 await self.page.wait_for_load_state('networkidle')
-                await asyncio.sleep(1.2)  # Extra wait for page to fully load
+                await self.page.wait_for_selector(v3_button_selector, state='hidden', timeout=5000)
                 
                 print("✅ Successfully switched to V3 view")
             else:
@@ -154,35 +284,20 @@ class VBLCompleteLogin(VBLPreciseScraper):
         """Check if login is required by looking for sign-in indicators"""
         try:
             # Look for "Sign In" button in header - indicates not logged in
-            sign_in_selectors = [
-                'button:has-text("Sign In")',
-                'a:has-text("Sign In")',
-                '[class*="sign-in"]'
-            ]
-            
-            for selector in sign_in_selectors:
-                try:
-                    if await self.page.is_visible(selector):
-                        print(f"🔍 Found sign-in indicator: {selector}")
-                        return True
-                except Exception:
-                    continue
+            try:
+                if await self.page.locator(self.SIGN_IN_SELECTOR).count():
+                    print("🔍 Found sign-in indicator")
+                    return True
+            except Exception:
+                pass
             
             # Look for user profile indicators - suggests logged in
-            profile_selectors = [
-                '[class*="profile"]',
-                '[class*="avatar"]',
-                'button:has-text("Logout")',
-                'a:has-text("Profile")'
-            ]
-            
-            for selector in profile_selectors:
-                try:
-                    if await self.page.is_visible(selector):
-                        print(f"✅ Found profile indicator - already logged in: {selector}")
-                        return False
-                except Exception:
-                    continue
+            try:
+                if await self.page.locator(self.PROFILE_SELECTOR).count():
+                    print("✅ Found profile indicator - already logged in")
+                    return False
+            except Exception:
+                pass
             
             # Default: assume login is needed if we can't determine
             print("❓ Cannot determine login status - assuming login needed")
@@ -258,14 +373,14 @@ class VBLCompleteLogin(VBLPreciseScraper):
         try:
             # Step 1: Enter Email
             print("📧 Step 1: Entering email...")
-            # Try multiple selectors for the email field within the modal
-            email_selectors = [
-                'div.v-card input[type="text"]',  # Email field within the modal
-                'input[aria-label="Email"]',
-                'input[placeholder*="email"]',
-                'div[class*="modal"] input[type="text"]',
-                'div[class*="dialog"] input[type="text"]'
-            ]
+            # Try multiple selectors for the email field within the modal,
+            # starting with the one that worked last time
+            email_selectors = self.EMAIL_SELECTORS
+            if self.preferred_email_selector:
+                email_selectors = (self.preferred_email_selector,) + tuple(
+                    selector for selector in email_selectors
+                    if selector != self.preferred_email_selector
+                )
             
             email_field = None
             for selector in email_selectors:
@@ -278,6 +393,7 @@ class VBLCompleteLogin(VBLPreciseScraper):
                             placeholder = await element.get_attribute('placeholder') or ""
                             if 'search' not in placeholder.lower():
                                 email_field = element
+                                self.preferred_email_selector = selector
                                 print(f"✅ Found email field with selector: {selector}")
                                 break
                     if email_field:
@@ -311,23 +427,20 @@ class VBLCompleteLogin(VBLPreciseScraper):
             await self.page.fill(password_selector, password)
             print("✅ Password entered")
             
-            # Small delay to let the form process the password input
-            await asyncio.sleep(0.6)
+            # Let the form enable its Sign In button before probing for it
+            try:
+                await self.page.wait_for_selector(
+                    f'{MODAL_SIGNIN_SELECTOR}:enabled', state='visible', timeout=3000
+                )
+            except Exception:
+                pass
             
             # Step 5: Click Final "Sign In" Button
             print("👆 Step 5: Clicking final 'Sign In' button...")
             
             # Try multiple approaches to find and click the sign-in button
-            final_signin_selectors = [
-                'div.v-card button:has-text("Sign In")',  # Within the modal card
-                'button[type="submit"]:has-text("Sign In")',  # Submit button variant
-                'button:has-text("Sign In"):not(:disabled)',  # Enabled sign-in button
-                'form button:has-text("Sign In")',  # Within a form
-                'button:has-text("Sign In")'  # Fallback
-            ]
-            
             sign_in_clicked = False
-            for selector in final_signin_selectors:
+            for selector in self.FINAL_SIGNIN_SELECTORS:
                 try:
                     print(f"🔍 Trying selector: {selector}")
                     # Wait for the button to be available and enabled
@@ -380,9 +493,6 @@ class VBLCompleteLogin(VBLPreciseScraper):
             await self.page.wait_for_selector(sign_in_button_selector, state='hidden', timeout=15000)
             print("✅ Main 'Sign In' button disappeared - login successful!")
             
-            # Additional confirmation: wait for page to fully update
-            await asyncio.sleep(1.2)
-            
             # Save the session for future use
             await self.save_session()
             
@@ -419,16 +529,44 @@ class VBLCompleteLogin(VBLPreciseScraper):
                 return False
 
 
+def write_results(output_file: Path, data, pretty: bool = False):
+    """Write results as compact JSON, indented only when asked for"""
+    if ORJSON_AVAILABLE:
+        output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+    elif pretty:
+        output_file.write_text(json.dumps(data, indent=2))
+    else:
+        output_file.write_text(json.dumps(data, separators=(',', ':')))
+
+
 async def main():
     """Main execution function"""
-    if len(sys.argv) < 2:
-        print("Usage: python3 vbl_complete_login.py <bracket_url> [username] [password]")
+    args = sys.argv[1:]
+    pretty = '--pretty' in args
+    full_assets = '--full-assets' in args
+    args = [arg for arg in args if arg not in ('--pretty', '--full-assets')]
+    urls_file = None
+    if args and args[0] == '--urls-file':
+        urls_file = Path(args[1]) if len(args) > 1 else None
+        args = args[2:]
+    
+    if urls_file is None and not args:
+        print("Usage: python3 vbl_complete_login.py [--pretty] [--full-assets] <bracket_url> [username] [password]")
+        print("       python3 vbl_complete_login.py [--pretty] [--full-assets] --urls-file <file> [username] [password]")
         print("Example: python3 vbl_complete_login.py 'https://volleyballlife.com/event/123/brackets' user@email.com password")
         sys.exit(1)
     
-    bracket_url = sys.argv[1]
-    username = sys.argv[2] if len(sys.argv) > 2 else None
-    password = sys.argv[3] if len(sys.argv) > 3 else None
+    if urls_file:
+        # One bracket URL per line; blank lines ignored
+        bracket_urls = [line.strip() for line in urls_file.read_text().splitlines() if line.strip()]
+        bracket_url = None
+        username = args[0] if len(args) > 0 else None
+        password = args[1] if len(args) > 1 else None
+    else:
+        bracket_urls = None
+        bracket_url = args[0]
+        username = args[1] if len(args) > 1 else None
+        password = args[2] if len(args) > 2 else None
     
     if bool(username) != bool(password):
         print("❌ Provide both username and password, or neither.")
@@ -440,18 +578,29 @@ async def main():
         sys.exit(1)
     
     print(f"🎯 VolleyballLife Complete Login & Scan System")
-    print(f"🌐 Target URL: {bracket_url}")
+    print(f"🌐 Target URL: {bracket_url or f'{len(bracket_urls)} URLs from {urls_file}'}")
     print(f"👤 Username: {username}")
     print(f"📋 Following four-phase login plan")
     
-    async with VBLCompleteLogin(headless=True, timeout=20000) as scraper:
+    block_resources = frozenset() if full_assets else None
+    async with VBLCompleteLogin(headless=True, timeout=20000, block_resources=block_resources) as scraper:
+        if bracket_urls is not None:
+            results = await scraper.scan_many(bracket_urls, username, password)
+            
+            output_file = Path("complete_workflow_results.json")
+            write_results(output_file, results, pretty)
+            print(f"\n💾 Results saved to {output_file}")
+            
+            for result in results:
+                print(f"   {result['status']}: {result.get('total_matches', 0)} matches - {result['url']}")
+            return
+        
         # Execute complete workflow
         result = await scraper.complete_login_and_scan(bracket_url, username, password)
         
         # Save results
         output_file = Path("complete_workflow_results.json")
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        write_results(output_file, result, pretty)
         print(f"\n💾 Results saved to {output_file}")
         
         # Print summary
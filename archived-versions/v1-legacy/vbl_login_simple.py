@@ -5,6 +5,7 @@ Uses requests + beautifulsoup instead of Playwright for better compatibility
 """
 
 import requests
+from requests.cookies import create_cookie
 import time
 import random
 import sys
@@ -12,9 +13,12 @@ import re
 from urllib.parse import urljoin, urlparse
 from http.cookiejar import CookieJar, MozillaCookieJar
 import urllib3
+from urllib3.util.request import ACCEPT_ENCODING
 import os
-import pickle
 import json
+import tempfile
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 # Disable SSL warnings for development
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -26,10 +30,56 @@ BASE_URL = "https://volleyballlife.com"
 
 # Session persistence
 COOKIES_FILE = "/Users/nathanhicks/Library/Containers/com.NathanHicks.MultiCourtScore/Data/Documents/vbl_session_cookies.json"
-SESSION_FILE = "/Users/nathanhicks/Library/Containers/com.NathanHicks.MultiCourtScore/Data/Documents/vbl_session.pkl"
+# Homepage ETag seen while logged in; lets is_session_valid use a conditional GET
+SESSION_META_FILE = "/Users/nathanhicks/Library/Containers/com.NathanHicks.MultiCourtScore/Data/Documents/vbl_session_meta.json"
+DUMP_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Page indicators, matched with bytes.find against the lowercased UTF-8 body
+LOGGED_IN_INDICATORS = (
+    b'logout', b'sign out', b'my account', b'dashboard',
+    b'profile', b'settings', b'welcome', b'hello',
+)
+LOGIN_REQUIRED_INDICATORS = (
+    b'sign in', b'login', b'log in', b'email', b'password',
+)
+# First signin/login/auth link on the page
+SIGNIN_HREF_RE = re.compile(
+    r'''href=["']([^"']*(?:signin|login|auth)[^"']*)["']''', re.IGNORECASE
+)
+
+# Form boundaries, located with two linear scans instead of one DOTALL
+# '<form>(.*?)</form>' match that can run to end-of-document on unclosed tags
+FORM_OPEN_RE = re.compile(r'<form\b[^>]*>', re.IGNORECASE)
+FORM_CLOSE_RE = re.compile(r'</form\s*>', re.IGNORECASE)
+
+VBL_PAGE_INDICATORS = (
+    ('navigation menu', b'nav'),
+    ('user profile', b'profile'),
+    ('tournaments', b'tournament'),
+    ('matches', b'match'),
+    ('teams', b'team'),
+    ('logout link', b'logout'),
+    ('sign out', b'sign out'),
+    ('dashboard', b'dashboard'),
+    ('my account', b'my account'),
+    ('welcome', b'welcome'),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def lowered_body(response_text):
+    """Lowercased UTF-8 bytes of a page, memoized for the most recent page"""
+    return response_text.encode('utf-8', 'replace').lower()
+
 
 class SimpleVBLLogin:
+    # Set once the cookies directory is known to exist, so saves skip makedirs
+    _cookies_dir_ready = False
+
     def __init__(self):
+        # One keep-alive Session: TLS is negotiated once and reused for every
+        # step. The flow is strictly sequential (each request depends on the
+        # previous response), so HTTP/2 multiplexing would not overlap anything.
         self.session = requests.Session()
         
         # Set a realistic user agent
@@ -37,7 +87,8 @@ class SimpleVBLLogin:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-us',
-            'Accept-Encoding': 'gzip, deflate',
+            # Includes 'br' when the brotli package is installed (~20% smaller HTML)
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
@@ -48,11 +99,30 @@ class SimpleVBLLogin:
         # Add timeout for all requests
         self.session.timeout = 30
         
+        # Human-like pauses are opt-in; they only precede credential submission
+        self.delays_enabled = False
+        
+        # Dumping verification pages to disk is opt-in (VBL_DEBUG_DUMP=1)
+        self.debug_dump = os.environ.get('VBL_DEBUG_DUMP') == '1'
+        
+        # ETag of the homepage as last seen while logged in
+        self.homepage_etag = None
+        
         # Load existing session if available
         self.load_session()
     
+    def _probe_session(self):
+        """Separate Session with this one's headers and a copy of its cookies"""
+        probe = requests.Session()
+        probe.headers.update(self.session.headers)
+        probe.verify = self.session.verify
+        probe.cookies.update(self.session.cookies)
+        return probe
+    
     def random_delay(self, min_seconds=2, max_seconds=5):
-        """Add random delay between actions"""
+        """Add random delay between actions (no-op unless delays_enabled)"""
+        if not self.delays_enabled:
+            return
         delay = random.uniform(min_seconds, max_seconds)
         print(f"⏱️  Waiting {delay:.1f} seconds...")
         time.sleep(delay)
@@ -60,8 +130,11 @@ class SimpleVBLLogin:
     def save_session(self):
         """Save session cookies and headers for persistence"""
         try:
-            # Ensure the directory exists
-            os.makedirs(os.path.dirname(COOKIES_FILE), exist_ok=True)
+            # Ensure the directory exists (checked once per process)
+            dirpath = os.path.dirname(COOKIES_FILE)
+            if not SimpleVBLLogin._cookies_dir_ready:
+                os.makedirs(dirpath, exist_ok=True)
+                SimpleVBLLogin._cookies_dir_ready = True
             
             # Save cookies as JSON
             cookie_dict = {}
@@ -74,14 +147,27 @@ class SimpleVBLLogin:
                     'expires': cookie.expires
                 }
             
-            with open(COOKIES_FILE, 'w') as f:
-                json.dump(cookie_dict, f, indent=2)
+            self._write_json_atomic(COOKIES_FILE, cookie_dict)
+            if self.homepage_etag:
+                self._write_json_atomic(SESSION_META_FILE, {'etag': self.homepage_etag})
             
             print(f"💾 Session saved with {len(cookie_dict)} cookies")
             
         except Exception as e:
             print(f"⚠️  Failed to save session: {e}")
     
+    def _write_json_atomic(self, path, data):
+        """Write JSON to a temp file and rename so a crash never leaves a partial file"""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.session.', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
     def load_session(self):
         """Load existing session cookies if available"""
         try:
@@ -92,15 +178,21 @@ class SimpleVBLLogin:
             with open(COOKIES_FILE, 'r') as f:
                 cookie_dict = json.load(f)
             
-            # Add cookies to session
+            # Add cookies to session; the file is our own, so insert the
+            # Cookie objects directly rather than going through cookies.set()
+            jar = self.session.cookies
             for name, cookie_data in cookie_dict.items():
-                self.session.cookies.set(
+                jar.set_cookie(create_cookie(
                     name=name,
                     value=cookie_data['value'],
-                    domain=cookie_data.get('domain'),
+                    domain=cookie_data.get('domain') or '',
                     path=cookie_data.get('path', '/'),
                     secure=cookie_data.get('secure', False)
-                )
+                ))
+            
+            if os.path.exists(SESSION_META_FILE):
+                with open(SESSION_META_FILE, 'r') as f:
+                    self.homepage_etag = json.load(f).get('etag')
             
             print(f"🔄 Loaded existing session with {len(cookie_dict)} cookies")
             return True
@@ -114,9 +206,10 @@ class SimpleVBLLogin:
         try:
             if os.path.exists(COOKIES_FILE):
                 os.remove(COOKIES_FILE)
-            if os.path.exists(SESSION_FILE):
-                os.remove(SESSION_FILE)
+            if os.path.exists(SESSION_META_FILE):
+                os.remove(SESSION_META_FILE)
             self.session.cookies.clear()
+            self.homepage_etag = None
             print("🗑️  Session data cleared")
         except Exception as e:
             print(f"⚠️  Failed to clear session: {e}")
@@ -125,11 +218,19 @@ class SimpleVBLLogin:
         """Check if the current session is still valid"""
         try:
             print("🔍 Checking if existing session is still valid...")
-            response = self.session.get(BASE_URL, timeout=10)
+            # Conditional GET: a 304 means the page is byte-identical to the
+            # one last judged logged-in, so the verdict cannot have changed
+            headers = {'If-None-Match': self.homepage_etag} if self.homepage_etag else None
+            response = self.session.get(BASE_URL, timeout=10, headers=headers)
+            
+            if response.status_code == 304:
+                print("✅ Existing session is valid! (homepage unchanged)")
+                return True
             
             if response.status_code == 200:
                 is_logged_in = self.check_login_status(response.text)
                 if is_logged_in:
+                    self.homepage_etag = response.headers.get('ETag')
                     print("✅ Existing session is valid!")
                     return True
                 else:
@@ -145,31 +246,17 @@ class SimpleVBLLogin:
     
     def check_login_status(self, response_text):
         """Check if already logged in by looking for specific indicators"""
-        text_lower = response_text.lower()
-        
-        # Look for logged-in indicators (these suggest we are logged in)
-        logged_in_indicators = [
-            'logout', 'sign out', 'my account', 'dashboard', 
-            'profile', 'settings', 'welcome', 'hello'
-        ]
-        
-        # Look for login required indicators (these suggest we are NOT logged in)
-        login_required_indicators = [
-            'sign in', 'login', 'log in', 'email', 'password'
-        ]
+        body_bytes = lowered_body(response_text)
         
-        logged_in_score = 0
-        login_required_score = 0
+        # Logged-in indicators suggest we are logged in; login-required
+        # indicators suggest we are NOT
+        logged_in_found = [kw.decode() for kw in LOGGED_IN_INDICATORS if body_bytes.find(kw) != -1]
+        login_required_found = [kw.decode() for kw in LOGIN_REQUIRED_INDICATORS if body_bytes.find(kw) != -1]
+        logged_in_score = len(logged_in_found)
+        login_required_score = len(login_required_found)
         
-        for indicator in logged_in_indicators:
-            if indicator in text_lower:
-                logged_in_score += 1
-                print(f"✅ Found logged-in indicator: '{indicator}'")
-        
-        for indicator in login_required_indicators:
-            if indicator in text_lower:
-                login_required_score += 1
-                print(f"❌ Found login-required indicator: '{indicator}'")
+        print(f"✅ Logged-in indicators: {logged_in_found}")
+        print(f"❌ Login-required indicators: {login_required_found}")
         
         # Determine login status
         if logged_in_score > login_required_score:
@@ -183,14 +270,16 @@ class SimpleVBLLogin:
         """Extract form data and action URL from HTML"""
         try:
             # Simple regex-based form parsing (since we can't use BeautifulSoup)
-            # Look for form tags
-            form_pattern = r'<form[^>]*>(.*?)</form>'
-            forms = re.findall(form_pattern, html_content, re.DOTALL | re.IGNORECASE)
+            # Use the first complete form on the page
+            form_open = FORM_OPEN_RE.search(html_content)
+            if not form_open:
+                return None, {}
             
-            if not forms:
+            form_close = FORM_CLOSE_RE.search(html_content, form_open.end())
+            if not form_close:
                 return None, {}
             
-            form_html = forms[0]  # Use first form
+            form_html = html_content[form_open.end():form_close.start()]
             
             # Extract action
             action_match = re.search(r'action=["\']([^"\']*)["\']', form_html, re.IGNORECASE)
@@ -234,18 +323,18 @@ class SimpleVBLLogin:
                 response_text = response.text
             
             # Save response to file for manual inspection
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"vbl_login_verification_{timestamp}.html"
-            filepath = f"/Users/nathanhicks/Library/Containers/com.NathanHicks.MultiCourtScore/Data/Documents/{filename}"
-            
-            try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(response_text)
-                print(f"📄 Response saved to: {filepath}")
-                print("   You can manually inspect this file to verify login status")
-            except Exception as e:
-                print(f"⚠️  Could not save response file: {e}")
+            if self.debug_dump:
+                timestamp = time.strftime(DUMP_TIMESTAMP_FORMAT)
+                filename = f"vbl_login_verification_{timestamp}.html"
+                filepath = f"/Users/nathanhicks/Library/Containers/com.NathanHicks.MultiCourtScore/Data/Documents/{filename}"
+                
+                try:
+                    with open(filepath, 'w', encoding='utf-8') as f:
+                        f.write(response_text)
+                    print(f"📄 Response saved to: {filepath}")
+                    print("   You can manually inspect this file to verify login status")
+                except Exception as e:
+                    print(f"⚠️  Could not save response file: {e}")
             
             # Analyze the response content
             text_length = len(response_text)
@@ -253,28 +342,19 @@ class SimpleVBLLogin:
             print(f"   • Content length: {text_length:,} characters")
             
             # Check for specific VolleyballLife elements
-            vbl_indicators = [
-                ('navigation menu', 'nav'),
-                ('user profile', 'profile'),
-                ('tournaments', 'tournament'),
-                ('matches', 'match'),
-                ('teams', 'team'),
-                ('logout link', 'logout'),
-                ('sign out', 'sign out'),
-                ('dashboard', 'dashboard'),
-                ('my account', 'my account'),
-                ('welcome', 'welcome')
-            ]
-            
             found_indicators = []
-            text_lower = response_text.lower()
+            body_bytes = lowered_body(response_text)
+            
+            missing_indicators = []
             
-            for name, keyword in vbl_indicators:
-                if keyword in text_lower:
+            for name, keyword in VBL_PAGE_INDICATORS:
+                if body_bytes.find(keyword) != -1:
                     found_indicators.append(name)
-                    print(f"   ✅ Found: {name}")
                 else:
-                    print(f"   ❌ Missing: {name}")
+                    missing_indicators.append(name)
+            
+            print(f"   ✅ Found: {', '.join(found_indicators) or 'none'}")
+            print(f"   ❌ Missing: {', '.join(missing_indicators) or 'none'}")
             
             # Final determination
             login_status = self.check_login_status(response_text)
@@ -309,45 +389,32 @@ class SimpleVBLLogin:
             print(f"🌐 Navigating to {BASE_URL}...")
             response = self.session.get(BASE_URL)
             response.raise_for_status()
-            
-            self.random_delay()
+            # Decode once; every .text access re-runs charset detection
+            body = response.text
             
             print("🔍 Checking if already logged in...")
-            if self.check_login_status(response.text):
+            if self.check_login_status(body):
                 print("🎉 Already logged in!")
+                self.homepage_etag = response.headers.get('ETag')
                 self.save_session()  # Save the session
                 return True
             
             print("🔐 Starting login process...")
             
             # Look for login/signin links or forms in the page
-            signin_patterns = [
-                r'href=["\']([^"\']*signin[^"\']*)["\']',
-                r'href=["\']([^"\']*login[^"\']*)["\']',
-                r'href=["\']([^"\']*auth[^"\']*)["\']'
-            ]
-            
-            login_url = None
-            for pattern in signin_patterns:
-                matches = re.findall(pattern, response.text, re.IGNORECASE)
-                if matches:
-                    login_url = matches[0]
-                    break
+            signin_match = SIGNIN_HREF_RE.search(body)
+            login_url = signin_match.group(1) if signin_match else None
             
             if login_url:
                 if not login_url.startswith('http'):
                     login_url = urljoin(BASE_URL, login_url)
                 print(f"🔗 Found login URL: {login_url}")
                 
-                self.random_delay()
-                
                 # Navigate to login page
                 print("👆 Accessing login page...")
                 login_response = self.session.get(login_url)
                 login_response.raise_for_status()
                 
-                self.random_delay()
-                
                 # Extract form data
                 action, form_data = self.extract_form_data(login_response.text)
                 
@@ -355,25 +422,45 @@ class SimpleVBLLogin:
                     print("⚠️  Could not find login form, trying direct authentication...")
                     # Fallback: try common authentication endpoints
                     auth_endpoints = ['/api/auth/login', '/auth/login', '/login', '/signin']
-                    for endpoint in auth_endpoints:
+                    auth_data = {
+                        'email': EMAIL,
+                        'password': PASSWORD,
+                        'username': EMAIL,  # Some sites use username instead
+                    }
+                    
+                    # Probe all endpoints concurrently, each on its own Session
+                    # so no two threads write the same cookie jar. Every probe
+                    # finishes before the first endpoint in list order that
+                    # answered 200/302 wins; only its cookies are kept
+                    auth_urls = [urljoin(BASE_URL, endpoint) for endpoint in auth_endpoints]
+                    probes = [self._probe_session() for _ in auth_urls]
+                    
+                    def try_auth(probe, auth_url):
                         try:
-                            auth_url = urljoin(BASE_URL, endpoint)
-                            auth_data = {
-                                'email': EMAIL,
-                                'password': PASSWORD,
-                                'username': EMAIL,  # Some sites use username instead
-                            }
-                            
+                            return probe.post(auth_url, data=auth_data, timeout=10).status_code
+                        except Exception:
+                            return None
+                    
+                    try:
+                        for auth_url in auth_urls:
                             print(f"🔑 Trying authentication at {auth_url}...")
-                            auth_response = self.session.post(auth_url, data=auth_data)
-                            
-                            if auth_response.status_code in [200, 302]:
-                                print("✅ Authentication successful!")
-                                self.save_session()  # Save the session
-                                return True
-                                
-                        except Exception as e:
-                            continue
+                        with ThreadPoolExecutor(max_workers=len(auth_urls)) as executor:
+                            statuses = list(executor.map(try_auth, probes, auth_urls))
+                        
+                        winner = next(
+                            (i for i, status in enumerate(statuses) if status in (200, 302)), None
+                        )
+                        auth_succeeded = winner is not None
+                        if auth_succeeded:
+                            print(f"✅ Authentication successful at {auth_urls[winner]}!")
+                            self.session.cookies.update(probes[winner].cookies)
+                    finally:
+                        for probe in probes:
+                            probe.close()
+                    
+                    if auth_succeeded:
+                        self.save_session()  # Save the session
+                        return True
                 
                 else:
                     # Use extracted form
@@ -383,11 +470,11 @@ class SimpleVBLLogin:
                     form_data['email'] = EMAIL
                     form_data['password'] = PASSWORD
                     
+                    self.random_delay()
+                    
                     print("📧 Submitting login credentials...")
                     login_submit = self.session.post(form_url, data=form_data)
                     
-                    self.random_delay()
-                    
                     # Check if login was successful
                     if login_submit.status_code in [200, 302]:
                         if self.check_login_status(login_submit.text):
@@ -399,7 +486,7 @@ class SimpleVBLLogin:
             print("🔍 Trying alternative login methods...")
             
             # Method 2: Look for any forms and try to submit credentials
-            action, form_data = self.extract_form_data(response.text)
+            action, form_data = self.extract_form_data(body)
             if form_data:
                 form_data['email'] = EMAIL
                 form_data['password'] = PASSWORD
@@ -407,8 +494,8 @@ class SimpleVBLLogin:
                 form_url = urljoin(BASE_URL, action) if action else BASE_URL
                 print("🔑 Submitting credentials to main form...")
                 
-                form_response = self.session.post(form_url, data=form_data)
                 self.random_delay()
+                form_response = self.session.post(form_url, data=form_data)
                 
                 if form_response.status_code in [200, 302]:
                     print("🎉 Login form submitted successfully!")
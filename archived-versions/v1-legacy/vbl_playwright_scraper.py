@@ -15,11 +15,17 @@ from urllib.parse import urljoin, urlparse
 
 from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
 
+# Resource types the scrapers never read; aborted so pages settle sooner
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
 
 class VBLPlaywrightScraper:
-    def __init__(self, headless: bool = True, timeout: int = 30000):
+    def __init__(self, headless: bool = True, timeout: int = 30000,
+                 block_resources: Optional[frozenset] = None):
         self.headless = headless
         self.timeout = timeout
+        # Pass an empty set to load every asset, e.g. when debugging layout
+        self.block_resources = BLOCKED_RESOURCE_TYPES if block_resources is None else frozenset(block_resources)
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
@@ -85,6 +91,8 @@ class VBLPlaywrightScraper:
             context_options['storage_state'] = storage_state
             
         self.context = await self.browser.new_context(**context_options)
+        if self.block_resources:
+            await self.context.route('**/*', self._route_filter)
         
         # Create new page
         self.page = await self.context.new_page()
@@ -93,6 +101,13 @@ class VBLPlaywrightScraper:
         
         print("✅ Browser initialized successfully")
         
+    async def _route_filter(self, route):
+        """Abort requests for blocked resource types, let the rest through"""
+        if route.request.resource_type in self.block_resources:
+            await route.abort()
+        else:
+            await route.continue_()
+            
     async def close(self):
         """Clean up browser resources"""
         if self.page:
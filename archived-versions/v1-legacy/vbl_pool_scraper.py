@@ -6,6 +6,7 @@ Specialized scraper for pool play pages where matches are displayed open
 
 import asyncio
 import json
+import logging
 import re
 import sys
 from datetime import datetime
@@ -13,8 +14,208 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
 from vbl_playwright_scraper import VBLPlaywrightScraper
 
+# orjson encodes the results file much faster; fall back to json if missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Per-container diagnostics go through logging so they cost nothing when disabled
+logger = logging.getLogger(__name__)
+
+# Candidate selectors for pool match containers, in priority order
+MATCH_CONTAINER_SELECTORS = (
+    '.match-card',
+    '.pool-match',
+    '.game-card',
+    '[class*="match"]',
+    '.match-container',
+    '.pool-game',
+    'div[data-match]',
+    '.bracket-match',  # Sometimes pools use bracket styling
+    'div.div-match-card',
+)
+# Any container appearing means the pool has rendered
+MATCH_CONTAINER_UNION = ', '.join(MATCH_CONTAINER_SELECTORS)
+
+# Last selector that found containers, per site host; tried first next time
+SELECTOR_CACHE_FILE = Path.home() / '.vbl_scraper_cache.json'
+_selector_cache: Optional[Dict[str, str]] = None
+
+
+def load_selector_cache() -> Dict[str, str]:
+    """Host -> last successful container selector (read from disk once)"""
+    global _selector_cache
+    if _selector_cache is None:
+        try:
+            _selector_cache = json.loads(SELECTOR_CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            _selector_cache = {}
+    return _selector_cache
+
+
+def remember_selector(host: str, selector: str):
+    """Record the selector that worked for host, persisting only on change"""
+    cache = load_selector_cache()
+    if cache.get(host) == selector:
+        return
+    cache[host] = selector
+    try:
+        SELECTOR_CACHE_FILE.write_text(json.dumps(cache))
+    except OSError as e:
+        logger.debug("Could not write selector cache: %s", e)
+
+# Pages kept open in one browser context when scanning several pool URLs
+MAX_POOL_PAGES = 4
+
+# Upper bound on containers extracted concurrently over the browser connection
+MAX_CONCURRENT_EXTRACTIONS = 16
+
+# Team name cleanup: drops the "team "/"match "/"game " prefixes and the
+# " ref:"/" ref"/" referee"/" official" suffixes, in the order they used to
+# be stripped one after another, in a single anchored match
+TEAM_NAME_CLEAN_RE = re.compile(
+    r'^(?:team )?(?:match )?(?:game )?(.*?)(?: official)?(?: referee)?(?: ref)?(?: ref:)?$',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Regex patterns, compiled once at import rather than looked up per call
+# Pool play team layouts in one alternation; the outer group name
+# (num / pair / vs) tells which layout matched
+POOL_TEAMS_RE = re.compile(
+    # "1 Team A / Player A  2 Team B / Player B" (numbers before teams)
+    r'(?P<num>\d+\s+(?P<num_team1>[A-Za-z\s]+/[A-Za-z\s]+)\s+\d+\s+(?P<num_team2>[A-Za-z\s]+/[A-Za-z\s]+))'
+    # "Team A / Player A  Team B / Player B" (sequential teams)
+    r'|(?P<pair>(?P<pair_team1>[A-Za-z\s]+/[A-Za-z\s]+)\s+(?P<pair_team2>[A-Za-z\s]+/[A-Za-z\s]+)(?:\s+Ref:|$))'
+    # "Team A vs Team B"
+    r'|(?P<vs>(?P<vs_team1>.+?)\s+vs?\s+(?P<vs_team2>.+?)(?:\s*[-—]\s*Court|\s*[-—]\s*Time|\s*[-—]\s*Match|\s*$))',
+    re.IGNORECASE
+)
+TIME_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(\d{1,2}:\d{2}\s*[AP]M)',  # 10:30AM, 2:15PM
+    r'(\d{1,2}[AP]M)',           # 10AM, 2PM
+    r'(\d{1,2}:\d{2})',          # 10:30, 14:15
+))
+# Hour / minute / optional AM-PM of a matched "H:MM[AM|PM]" time
+TIME_PARTS_RE = re.compile(r'(\d{1,2}):(\d{2})\s*([AP]M)?', re.IGNORECASE)
+COURT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Court\s*[:#]?\s*(\d+)',
+    r'Ct\s*[:#]?\s*(\d+)',
+    r'Court\s+([A-Za-z0-9]+)',
+))
+MATCH_NUMBER_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Match\s*[:#]?\s*(\d+)',
+    r'Game\s*[:#]?\s*(\d+)',
+    r'#(\d+)',
+))
+# Time, court and match number in one alternation. Each alternative is named
+# after the pattern it mirrors above and sits inside a lookahead, so finditer
+# tests every position without consuming text: a court or match number never
+# swallows the digits of a time that overlaps it. The *_value groups hold the
+# captured value, and the lists below give each field's pattern priority
+MATCH_META_RE = re.compile(
+    r'(?=(?P<court_num>Court\s*[:#]?\s*(?P<court_num_value>\d+))'
+    r'|(?P<ct_num>Ct\s*[:#]?\s*(?P<ct_num_value>\d+))'
+    r'|(?P<court_name>Court\s+(?P<court_name_value>[A-Za-z0-9]+))'
+    r'|(?P<match_num>Match\s*[:#]?\s*(?P<match_num_value>\d+))'
+    r'|(?P<game_num>Game\s*[:#]?\s*(?P<game_num_value>\d+))'
+    r'|(?P<hash_num>#(?P<hash_num_value>\d+))'
+    r'|(?P<time_ampm>(?P<time_ampm_value>\d{1,2}:\d{2}\s*[AP]M))'
+    r'|(?P<time_hour>(?P<time_hour_value>\d{1,2}[AP]M))'
+    r'|(?P<time_24>(?P<time_24_value>\d{1,2}:\d{2})))',
+    re.IGNORECASE
+)
+MATCH_META_TIME = ('time_ampm', 'time_hour', 'time_24')
+MATCH_META_COURT = ('court_num', 'ct_num', 'court_name')
+MATCH_META_NUMBER = ('match_num', 'game_num', 'hash_num')
+POOL_URL_RE = re.compile(r'/pools/(\d+)')
+HTTP_URL_RE = re.compile(r'(https?://[^\'"]+)')
+# Any referee indicator, matched against lowercased text
+REFEREE_RE = re.compile('|'.join(map(re.escape, (
+    'ref:', 'referee', 'official', 'umpire', 'score', 'court'
+))))
+
+# Walks the candidate selectors in priority order inside the page and returns
+# the first one with visible, non-trivial elements (with their texts), so the
+# whole fallback chain costs one round trip instead of several per element
+FIND_MATCH_CONTAINERS_JS = """
+(selectors) => {
+    for (const selector of selectors) {
+        let elements;
+        try {
+            elements = document.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        const hits = [];
+        elements.forEach((el, index) => {
+            const visible = !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+            const text = el.textContent || '';
+            if (visible && text.trim().length > 10) {
+                hits.push({index, text});
+            }
+        });
+        if (hits.length) {
+            return {selector, hits};
+        }
+    }
+    return null;
+}
+"""
+
+# Visible VMIX buttons (href/onclick) and match-id data attributes of one
+# container in a single round trip. Button groups mirror, in priority order,
+# button/a/.btn:has-text("VMIX"), [class*="vmix"] and button:has-text("V-Mix")
+VMIX_INFO_JS = """
+(container) => {
+    const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const hasText = (el, text) => (el.textContent || '').toLowerCase().includes(text);
+    const all = selector => Array.from(container.querySelectorAll(selector));
+    const candidates = [
+        ...all('button').filter(el => hasText(el, 'vmix')),
+        ...all('a').filter(el => hasText(el, 'vmix')),
+        ...all('[class*="vmix"]'),
+        ...all('button').filter(el => hasText(el, 'v-mix')),
+        ...all('.btn').filter(el => hasText(el, 'vmix')),
+    ];
+    return {
+        buttons: candidates.filter(visible).map(el => ({
+            href: el.getAttribute('href'),
+            onclick: el.getAttribute('onclick')
+        })),
+        match_ids: ['data-match-id', 'data-id', 'data-match'].map(attr => container.getAttribute(attr))
+    };
+}
+"""
+
+# div/span/p elements whose text contains "vs" in any letter case
+VS_CANDIDATES_XPATH = (
+    "xpath=//*[(self::div or self::span or self::p)"
+    " and contains(translate(., 'VS', 'vs'), 'vs')]"
+)
+
+# Visibility and text for every element matched by a selector, in one round trip
+VISIBLE_TEXTS_JS = """
+(elements) => elements.map(el => ({
+    visible: !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length),
+    text: el.textContent || ''
+}))
+"""
+
+
+def has_meaningful_text(text: str, min_length: int) -> bool:
+    """len(text.strip()) > min_length, without copying text in the common case"""
+    if len(text) <= min_length:
+        return False
+    if not text[0].isspace() and not text[-1].isspace():
+        return True
+    return len(text.strip()) > min_length
+
 
 class VBLPoolScraper(VBLPlaywrightScraper):
     """Pool play scraper for open match cards"""
@@ -28,7 +229,7 @@ class VBLPoolScraper(VBLPlaywrightScraper):
         
         if '/pools/' in url_lower:
             # Extract pool number from URL if possible
-            pool_match = re.search(r'/pools/(\d+)', url_lower)
+            pool_match = POOL_URL_RE.search(url_lower)
             pool_num = pool_match.group(1) if pool_match else "Unknown"
             return "Pool Play", f"Pool {pool_num}"
         elif '/brackets/' in url_lower:
@@ -64,8 +265,11 @@ class VBLPoolScraper(VBLPlaywrightScraper):
             await self.page.goto(pool_url)
             await self.page.wait_for_load_state('networkidle')
             
-            # Wait for page to fully load
-            await asyncio.sleep(2.0)
+            # Wait (up to 2s) for match containers to render rather than sleeping
+            try:
+                await self.page.wait_for_selector(MATCH_CONTAINER_UNION, state='visible', timeout=2000)
+            except PlaywrightTimeoutError:
+                pass
             
             # Extract matches from the open display
             matches_data = await self.extract_open_matches(match_type, type_detail)
@@ -92,6 +296,53 @@ class VBLPoolScraper(VBLPlaywrightScraper):
                 'status': 'error'
             }
     
+    async def extract_pool_matches_batch(self, pool_urls: List[str], username: str = None,
+                                         password: str = None) -> List[Dict]:
+        """
+        Extract several pool URLs with this one browser and authenticated context.
+        
+        Logs in once, then scans the URLs concurrently on a small pool of pages
+        (at most MAX_POOL_PAGES) that share the context's cookies. Results are
+        returned in input order.
+        """
+        if username and password:
+            print("🔐 Logging in...")
+            if not await self.login(username, password):
+                print("❌ Login failed - continuing anyway")
+        
+        # Page pool: this scraper's own page plus extra pages in the same context
+        page_count = min(MAX_POOL_PAGES, len(pool_urls))
+        pages = asyncio.Queue()
+        await pages.put(self.page)
+        extra_pages = []
+        for _ in range(page_count - 1):
+            page = await self.context.new_page()
+            page.set_default_timeout(self.timeout)
+            extra_pages.append(page)
+            await pages.put(page)
+        
+        async def scan(pool_url: str) -> Dict:
+            page = await pages.get()
+            try:
+                return await self._page_worker(page).extract_pool_matches(pool_url)
+            finally:
+                await pages.put(page)
+        
+        try:
+            return await asyncio.gather(*(scan(url) for url in pool_urls))
+        finally:
+            for page in extra_pages:
+                await page.close()
+    
+    def _page_worker(self, page) -> 'VBLPoolScraper':
+        """A scraper view that shares this browser/context but drives another page"""
+        worker = VBLPoolScraper(headless=self.headless, timeout=self.timeout)
+        worker.playwright = self.playwright
+        worker.browser = self.browser
+        worker.context = self.context
+        worker.page = page
+        return worker
+    
     async def extract_open_matches(self, match_type: str, type_detail: str) -> List[Dict]:
         """
         Extract match data from open match displays (no need to click cards)
@@ -99,48 +350,34 @@ class VBLPoolScraper(VBLPlaywrightScraper):
         print("🏊 Extracting matches from open display...")
         matches_data = []
         
-        # Try different selectors for match containers in pool play
-        possible_selectors = [
-            '.match-card',
-            '.pool-match',
-            '.game-card', 
-            '[class*="match"]',
-            '.match-container',
-            '.pool-game',
-            'div[data-match]',
-            '.bracket-match',  # Sometimes pools use bracket styling
-            'div.div-match-card'
-        ]
-        
         match_containers = []
+        container_texts = []
         successful_selector = None
         
-        for selector in possible_selectors:
-            try:
-                print(f"🔍 Trying selector: {selector}")
-                elements = await self.page.locator(selector).all()
-                
-                if elements:
-                    # Filter for visible elements with content
-                    visible_elements = []
-                    for i, element in enumerate(elements):
-                        try:
-                            if await element.is_visible():
-                                text = await element.text_content() or ""
-                                if len(text.strip()) > 10:  # Has meaningful content
-                                    visible_elements.append(element)
-                                    print(f"   ✅ Found match {i + 1}: {text[:100]}...")
-                        except Exception:
-                            continue
-                    
-                    if visible_elements:
-                        match_containers = visible_elements
-                        successful_selector = selector
-                        break
-                        
-            except Exception as e:
-                print(f"   ❌ Selector {selector} failed: {e}")
-                continue
+        try:
+            # Try different selectors for match containers in pool play,
+            # starting with the one that last worked on this site
+            host = urlparse(self.page.url).netloc
+            selectors = list(MATCH_CONTAINER_SELECTORS)
+            preferred = load_selector_cache().get(host)
+            if preferred in selectors:
+                selectors.remove(preferred)
+                selectors.insert(0, preferred)
+            
+            found = await self.page.evaluate(FIND_MATCH_CONTAINERS_JS, selectors)
+            if found:
+                successful_selector = found['selector']
+                remember_selector(host, successful_selector)
+                elements = await self.page.locator(successful_selector).all()
+                debug = logger.isEnabledFor(logging.DEBUG)
+                for hit in found['hits']:
+                    if hit['index'] < len(elements):
+                        match_containers.append(elements[hit['index']])
+                        container_texts.append(hit['text'])
+                        if debug:
+                            logger.debug("Found match %d: %s...", hit['index'] + 1, hit['text'][:100])
+        except Exception as e:
+            print(f"   ❌ Container lookup failed: {e}")
         
         if not match_containers:
             print("❌ No match containers found, trying alternative approach...")
@@ -148,46 +385,55 @@ class VBLPoolScraper(VBLPlaywrightScraper):
         
         print(f"✅ Found {len(match_containers)} match containers with selector: {successful_selector}")
         
-        # Process each match container
-        for i, container in enumerate(match_containers):
-            try:
-                print(f"🎯 Processing match {i + 1}/{len(match_containers)}...")
-                
-                match_data = await self.extract_match_data_from_container(container, i, match_type, type_detail)
-                if match_data:
-                    matches_data.append(match_data)
-                    print(f"✅ Match {i + 1} extracted successfully")
-                else:
-                    print(f"⚠️ Match {i + 1} - no data extracted")
-                    
-            except Exception as e:
-                print(f"❌ Error processing match {i + 1}: {e}")
-                continue
+        # Process match containers concurrently; each one is independent I/O
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+        
+        async def process(i: int, container) -> Optional[Dict]:
+            async with semaphore:
+                logger.debug("Processing match %d/%d...", i + 1, len(match_containers))
+                return await self.extract_match_data_from_container(
+                    container, i, match_type, type_detail, full_text=container_texts[i]
+                )
+        
+        results = await asyncio.gather(
+            *(process(i, container) for i, container in enumerate(match_containers)),
+            return_exceptions=True
+        )
+        
+        for i, match_data in enumerate(results):
+            if isinstance(match_data, Exception):
+                logger.warning("Error processing match %d: %s", i + 1, match_data)
+            elif match_data:
+                matches_data.append(match_data)
+                logger.debug("Match %d extracted successfully", i + 1)
+            else:
+                logger.debug("Match %d - no data extracted", i + 1)
         
         return matches_data
     
-    async def extract_match_data_from_container(self, container, index: int, match_type: str, type_detail: str) -> Optional[Dict]:
+    async def extract_match_data_from_container(self, container, index: int, match_type: str, type_detail: str,
+                                                full_text: Optional[str] = None) -> Optional[Dict]:
         """
         Extract match data from a single container (pool matches are open, no clicking needed)
+        
+        full_text: the container's text if already read, to skip another DOM read
         """
         try:
             # Get all text content from the container
-            full_text = await container.text_content() or ""
+            if full_text is None:
+                full_text = await container.text_content() or ""
             
-            print(f"🔍 Container text: {full_text[:200]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Container text: %s...", full_text[:200])
             
-            # Extract team names - look for various patterns
-            team_names = await self.extract_team_names_from_text(full_text)
-            
-            # Extract time if present
-            time_display = self.extract_time_from_text(full_text)
-            print(f"   ⏰ Extracted time: {time_display}")
-            
-            # Extract court if present  
-            court_display = self.extract_court_from_text(full_text)
-            
-            # Extract match number if present
-            match_number = self.extract_match_number_from_text(full_text)
+            # Text parsing is pure CPU work; run it off the event loop so the
+            # other containers' browser round trips keep moving meanwhile
+            meta = await asyncio.to_thread(self._extract_all_meta, full_text)
+            team_names = meta['team_names']
+            time_display = meta['time']
+            court_display = meta['court']
+            match_number = meta['match_number']
+            logger.debug("Extracted time: %s", time_display)
             
             # Look for VMIX button and extract API URL
             api_url = await self.extract_api_url_from_container(container)
@@ -212,132 +458,113 @@ class VBLPoolScraper(VBLPlaywrightScraper):
             return match_data
             
         except Exception as e:
-            print(f"❌ Error extracting match data: {e}")
+            logger.warning("Error extracting match data: %s", e)
             return None
     
+    def _extract_all_meta(self, full_text: str) -> Dict:
+        """Parse team names, time, court and match number out of a container's text"""
+        time_display, court_display, match_number = self.extract_meta_from_text(full_text)
+        return {
+            'team_names': self.find_team_names(full_text),
+            'time': time_display,
+            'court': court_display,
+            'match_number': match_number,
+        }
+    
     async def extract_team_names_from_text(self, text: str) -> List[str]:
         """
         Extract team names from match text, avoiding referee names
         """
-        print(f"🔍 Extracting team names from: {text[:200]}")
-        
-        # Pool play specific patterns - numbers often precede team names
-        pool_patterns = [
-            # Pattern: "1 Team A / Player A  2 Team B / Player B" (numbers before teams)
-            r'(\d+)\s+([A-Za-z\s]+/[A-Za-z\s]+)\s+(\d+)\s+([A-Za-z\s]+/[A-Za-z\s]+)',
-            # Pattern: "Team A / Player A  Team B / Player B" (sequential teams)
-            r'([A-Za-z\s]+/[A-Za-z\s]+)\s+([A-Za-z\s]+/[A-Za-z\s]+)(?:\s+Ref:|$)',
-            # Pattern with VS: "Team A vs Team B"
-            r'(.+?)\s+vs?\s+(.+?)(?:\s*[-—]\s*Court|\s*[-—]\s*Time|\s*[-—]\s*Match|\s*$)',
-        ]
+        return self.find_team_names(text)
+    
+    def find_team_names(self, text: str) -> List[str]:
+        """Synchronous core of extract_team_names_from_text"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracting team names from: %s", text[:200])
         
-        for pattern in pool_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                if len(match.groups()) >= 4:  # Number + team pattern
-                    team1 = match.group(2).strip()
-                    team2 = match.group(4).strip()
-                elif len(match.groups()) >= 2:  # Direct team pattern
-                    team1 = match.group(1).strip()
-                    team2 = match.group(2).strip()
-                else:
-                    continue
-                
-                print(f"   Found potential teams: '{team1}' vs '{team2}'")
+        # Single pass over the text; candidates come back in document order
+        for match in POOL_TEAMS_RE.finditer(text):
+            layout = match.lastgroup
+            team1 = match.group(f'{layout}_team1').strip()
+            team2 = match.group(f'{layout}_team2').strip()
+            
+            logger.debug("Found potential teams: '%s' vs '%s'", team1, team2)
+            
+            # Filter out referee indicators and clean names
+            if not self.is_likely_referee(team1.lower()) and not self.is_likely_referee(team2.lower()):
+                team1_clean = self.clean_team_name(team1)
+                team2_clean = self.clean_team_name(team2)
                 
-                # Filter out referee indicators and clean names
-                if not self.is_likely_referee(team1) and not self.is_likely_referee(team2):
-                    team1_clean = self.clean_team_name(team1)
-                    team2_clean = self.clean_team_name(team2)
-                    
-                    if team1_clean and team2_clean and len(team1_clean) > 3 and len(team2_clean) > 3:
-                        print(f"   ✅ Extracted teams: '{team1_clean}' vs '{team2_clean}'")
-                        return [team1_clean, team2_clean]
+                if team1_clean and team2_clean and len(team1_clean) > 3 and len(team2_clean) > 3:
+                    logger.debug("Extracted teams: '%s' vs '%s'", team1_clean, team2_clean)
+                    return [team1_clean, team2_clean]
         
-        print("   ❌ No team names found with pool patterns")
+        logger.debug("No team names found with pool patterns")
         return []
     
-    def is_likely_referee(self, text: str) -> bool:
-        """Check if text is likely a referee name"""
-        ref_indicators = ['ref:', 'referee', 'official', 'umpire', 'score', 'court']
-        text_lower = text.lower()
-        return any(indicator in text_lower for indicator in ref_indicators)
+    def is_likely_referee(self, text_lower: str) -> bool:
+        """Check if text (already lowercased by the caller) is likely a referee name"""
+        return REFEREE_RE.search(text_lower) is not None
     
     def clean_team_name(self, name: str) -> str:
         """Clean up team name by removing extra whitespace and common prefixes/suffixes"""
-        # Remove common prefixes
-        prefixes_to_remove = ['team ', 'match ', 'game ']
-        suffixes_to_remove = [' ref:', ' ref', ' referee', ' official']
+        name = TEAM_NAME_CLEAN_RE.match(name).group(1)
         
-        name_lower = name.lower()
+        # Clean whitespace
+        return ' '.join(name.split())
+    
+    def extract_meta_from_text(self, text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Extract (time, court, match number) in a single pass over the text.
         
-        # Remove prefixes
-        for prefix in prefixes_to_remove:
-            if name_lower.startswith(prefix):
-                name = name[len(prefix):]
-                name_lower = name.lower()
+        Keeps the first hit of every pattern, then picks per field in the same
+        priority order as the extract_*_from_text methods.
+        """
+        first_hits = {}
+        for match in MATCH_META_RE.finditer(text):
+            first_hits.setdefault(match.lastgroup, match.group(f'{match.lastgroup}_value'))
         
-        # Remove suffixes
-        for suffix in suffixes_to_remove:
-            if name_lower.endswith(suffix):
-                name = name[:len(name)-len(suffix)]
-                name_lower = name.lower()
+        def pick(names: Tuple[str, ...]) -> Optional[str]:
+            return next((first_hits[name] for name in names if name in first_hits), None)
         
-        # Clean whitespace
-        return ' '.join(name.split()).strip()
+        time_str = pick(MATCH_META_TIME)
+        return (
+            self.fix_time(time_str) if time_str else None,
+            pick(MATCH_META_COURT),
+            pick(MATCH_META_NUMBER),
+        )
+    
+    def fix_time(self, time_str: str) -> str:
+        """
+        Fix corrupted times like "18:00AM" -> "8:00AM".
+        
+        Only AM/PM times are corrected; bare 24-hour times such as "14:15"
+        are valid and returned unchanged.
+        """
+        parts = TIME_PARTS_RE.match(time_str)
+        if not parts or not parts.group(3) or int(parts.group(1)) <= 12:
+            return time_str
+        
+        # Corrupted hours (like 18, 28, 38) keep their last digit
+        am_pm = parts.group(3).upper()
+        corrected_hour = int(parts.group(1)) % 10 or (12 if am_pm == 'PM' else 10)
+        corrected_time = f"{corrected_hour}:{parts.group(2)}{am_pm}"
+        logger.debug("Fixed time from '%s' to '%s'", time_str, corrected_time)
+        return corrected_time
     
     def extract_time_from_text(self, text: str) -> Optional[str]:
         """Extract time from match text and fix corrupted times"""
-        time_patterns = [
-            r'(\d{1,2}:\d{2}\s*[AP]M)',  # 10:30AM, 2:15PM
-            r'(\d{1,2}[AP]M)',           # 10AM, 2PM
-            r'(\d{1,2}:\d{2})'           # 10:30, 14:15
-        ]
-        
-        for pattern in time_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in TIME_PATTERNS:
+            match = pattern.search(text)
             if match:
-                time_str = match.group(1)
-                # Fix corrupted times like "18:00AM" -> "8:00AM"
-                if ':' in time_str:
-                    try:
-                        time_part = time_str.replace('AM', '').replace('PM', '').replace('am', '').replace('pm', '').strip()
-                        hour, minute = time_part.split(':')
-                        hour_int = int(hour)
-                        minute_int = int(minute)
-                        
-                        # Fix corrupted hours (like 18, 28, 38 should be 8, 8, 8)
-                        am_pm = 'AM' if 'AM' in time_str.upper() else 'PM'
-                        print(f"   🔍 Time debugging: hour={hour_int}, minute={minute_int}, am_pm={am_pm}")
-                        
-                        if hour_int > 12:
-                            # Extract last digit for hour
-                            corrected_hour = hour_int % 10
-                            if corrected_hour == 0:
-                                corrected_hour = 12 if am_pm == 'PM' else 10
-                            corrected_time = f"{corrected_hour}:{minute:02d}{am_pm}"
-                            print(f"   🔧 Fixed time from '{time_str}' to '{corrected_time}'")
-                            return corrected_time
-                        else:
-                            print(f"   ✅ Time looks normal: {time_str}")
-                            return time_str
-                    except (ValueError, IndexError):
-                        return time_str
-                else:
-                    return time_str
+                return self.fix_time(match.group(1))
         
         return None
     
     def extract_court_from_text(self, text: str) -> Optional[str]:
         """Extract court from match text"""
-        court_patterns = [
-            r'Court\s*[:#]?\s*(\d+)',
-            r'Ct\s*[:#]?\s*(\d+)',
-            r'Court\s+([A-Za-z0-9]+)'
-        ]
-        
-        for pattern in court_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in COURT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         
@@ -345,14 +572,8 @@ class VBLPoolScraper(VBLPlaywrightScraper):
     
     def extract_match_number_from_text(self, text: str) -> Optional[str]:
         """Extract match number from text"""
-        match_patterns = [
-            r'Match\s*[:#]?\s*(\d+)',
-            r'Game\s*[:#]?\s*(\d+)',
-            r'#(\d+)'
-        ]
-        
-        for pattern in match_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in MATCH_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         
@@ -363,45 +584,28 @@ class VBLPoolScraper(VBLPlaywrightScraper):
         Look for VMIX button within the container and extract API URL
         """
         try:
-            # Look for VMIX button within this container
-            vmix_selectors = [
-                'button:has-text("VMIX")',
-                'a:has-text("VMIX")', 
-                '[class*="vmix"]',
-                'button:has-text("V-Mix")',
-                '.btn:has-text("VMIX")'
-            ]
+            # Read VMIX buttons and match-id attributes in one round trip
+            vmix_info = await container.evaluate(VMIX_INFO_JS)
             
-            for selector in vmix_selectors:
-                try:
-                    vmix_elements = await container.locator(selector).all()
-                    for vmix_element in vmix_elements:
-                        if await vmix_element.is_visible():
-                            # Try to get href or onclick attribute
-                            href = await vmix_element.get_attribute('href')
-                            onclick = await vmix_element.get_attribute('onclick')
-                            
-                            if href and 'vmix' in href.lower():
-                                return href
-                            elif onclick and 'vmix' in onclick.lower():
-                                # Extract URL from onclick
-                                url_match = re.search(r'(https?://[^\'"]+)', onclick)
-                                if url_match:
-                                    return url_match.group(1)
-                                    
-                except Exception:
-                    continue
+            # Look for VMIX button within this container
+            for button in vmix_info['buttons']:
+                # Try to get href or onclick attribute
+                href = button['href']
+                onclick = button['onclick']
+                
+                if href and 'vmix' in href.lower():
+                    return href
+                elif onclick and 'vmix' in onclick.lower():
+                    # Extract URL from onclick
+                    url_match = HTTP_URL_RE.search(onclick)
+                    if url_match:
+                        return url_match.group(1)
             
             # If no VMIX button found, generate API URL from match ID if possible
             # Look for data attributes that might contain match ID
-            match_id_attrs = ['data-match-id', 'data-id', 'data-match']
-            for attr in match_id_attrs:
-                try:
-                    match_id = await container.get_attribute(attr)
-                    if match_id:
-                        return f"https://api.volleyballlife.com/api/v1.0/matches/{match_id}/vmix?bracket=false"
-                except Exception:
-                    continue
+            for match_id in vmix_info['match_ids']:
+                if match_id:
+                    return f"https://api.volleyballlife.com/api/v1.0/matches/{match_id}/vmix?bracket=false"
                     
         except Exception as e:
             print(f"⚠️ Error extracting API URL: {e}")
@@ -415,26 +619,28 @@ class VBLPoolScraper(VBLPlaywrightScraper):
         print("🔄 Using alternative extraction approach...")
         
         try:
-            # Get all text content and try to parse it
-            page_content = await self.page.content()
-            
-            # Look for any elements that might contain match data
-            all_elements = await self.page.locator('div, span, p').all()
+            # Only div/span/p elements whose text contains "vs" (any case) can be
+            # matches, so filter in the browser; handles and visibility/text
+            # are fetched once each and zipped by position
+            candidate_selector = VS_CANDIDATES_XPATH
+            all_elements = await self.page.locator(candidate_selector).all()
+            element_info = await self.page.eval_on_selector_all(candidate_selector, VISIBLE_TEXTS_JS)
             
             matches_data = []
-            for i, element in enumerate(all_elements):
+            for element, info in zip(all_elements, element_info):
                 try:
-                    if await element.is_visible():
-                        text = await element.text_content() or ""
-                        if 'vs' in text.lower() and len(text.strip()) > 20:
+                    if info['visible']:
+                        text = info['text']
+                        if has_meaningful_text(text, 20) and 'vs' in text.lower():
                             # This might be a match
                             team_names = await self.extract_team_names_from_text(text)
                             if len(team_names) >= 2:
+                                time_display, court_display, _ = self.extract_meta_from_text(text)
                                 match_data = {
                                     'index': len(matches_data),
                                     'match_number': None,
-                                    'time': self.extract_time_from_text(text),
-                                    'court': self.extract_court_from_text(text),
+                                    'time': time_display,
+                                    'court': court_display,
                                     'team_names': team_names,
                                     'team1': team_names[0],
                                     'team2': team_names[1],
@@ -460,16 +666,44 @@ class VBLPoolScraper(VBLPlaywrightScraper):
             return []
 
 
+def print_result_summary(result: Dict):
+    """Print the outcome of one pool extraction"""
+    if result['status'] == 'success':
+        print(f"\n🎉 Pool extraction successful!")
+        print(f"   📊 Found {result['total_matches']} matches")
+        print(f"   🏊 Type: {result.get('match_type', 'Unknown')} - {result.get('type_detail', '')}")
+        
+        # Show sample matches
+        for i, match in enumerate(result['matches'][:3]):
+            team1 = match.get('team1', '?')
+            team2 = match.get('team2', '?') 
+            court = match.get('court', '?')
+            time = match.get('time', '?')
+            api_url = '✅' if match.get('api_url') else '❌'
+            
+            print(f"   🏐 Match {i+1}: {team1} vs {team2}")
+            print(f"      📍 Court: {court}, ⏰ Time: {time}, 🔗 API: {api_url}")
+            
+    else:
+        print(f"💥 Pool extraction failed: {result.get('error', 'Unknown error')}")
+
+
 async def main():
     """Main execution function for pool play scanning"""
     if len(sys.argv) < 2:
-        print("Usage: python3 vbl_pool_scraper.py <pool_url> [username] [password]")
+        print("Usage: python3 vbl_pool_scraper.py <pool_url> [pool_url ...] [username] [password]")
         print("Example: python3 vbl_pool_scraper.py 'https://volleyballlife.com/event/123/pools/456' user@email.com password")
         sys.exit(1)
     
-    pool_url = sys.argv[1]
-    username = sys.argv[2] if len(sys.argv) > 2 else None
-    password = sys.argv[3] if len(sys.argv) > 3 else None
+    # URLs come first; anything else is the credential pair
+    pool_urls = [arg for arg in sys.argv[1:] if arg.startswith('http')]
+    credentials = [arg for arg in sys.argv[1:] if not arg.startswith('http')]
+    username = credentials[0] if len(credentials) > 0 else None
+    password = credentials[1] if len(credentials) > 1 else None
+    
+    if not pool_urls:
+        print("❌ No pool URLs provided.")
+        sys.exit(1)
     
     if bool(username) != bool(password):
         print("❌ Provide both username and password, or neither.")
@@ -481,38 +715,36 @@ async def main():
         sys.exit(1)
     
     print(f"🏊 VolleyballLife Pool Play Scraper")
-    print(f"🌐 Target URL: {pool_url}")
+    for pool_url in pool_urls:
+        print(f"🌐 Target URL: {pool_url}")
     print(f"👤 Username: {username}")
     
     async with VBLPoolScraper(headless=True, timeout=20000) as scraper:
         # Execute pool extraction
-        result = await scraper.extract_pool_matches(pool_url, username, password)
+        if len(pool_urls) == 1:
+            result = await scraper.extract_pool_matches(pool_urls[0], username, password)
+            results = [result]
+        else:
+            results = await scraper.extract_pool_matches_batch(pool_urls, username, password)
+            result = {
+                'urls_scanned': len(pool_urls),
+                'total_matches': sum(r.get('total_matches', 0) for r in results),
+                'results': results,
+                'status': 'success' if all(r['status'] == 'success' for r in results) else 'partial'
+            }
         
         # Save results
         output_file = Path("complete_workflow_results.json")
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        if ORJSON_AVAILABLE:
+            output_file.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(result, f, indent=2)
         print(f"\n💾 Results saved to {output_file}")
         
         # Print summary
-        if result['status'] == 'success':
-            print(f"\n🎉 Pool extraction successful!")
-            print(f"   📊 Found {result['total_matches']} matches")
-            print(f"   🏊 Type: {result.get('match_type', 'Unknown')} - {result.get('type_detail', '')}")
-            
-            # Show sample matches
-            for i, match in enumerate(result['matches'][:3]):
-                team1 = match.get('team1', '?')
-                team2 = match.get('team2', '?') 
-                court = match.get('court', '?')
-                time = match.get('time', '?')
-                api_url = '✅' if match.get('api_url') else '❌'
-                
-                print(f"   🏐 Match {i+1}: {team1} vs {team2}")
-                print(f"      📍 Court: {court}, ⏰ Time: {time}, 🔗 API: {api_url}")
-                
-        else:
-            print(f"💥 Pool extraction failed: {result.get('error', 'Unknown error')}")
+        for pool_result in results:
+            print_result_summary(pool_result)
 
 
 if __name__ == "__main__":
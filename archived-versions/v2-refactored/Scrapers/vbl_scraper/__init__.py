@@ -5,7 +5,7 @@ Consolidated scraper for VolleyballLife bracket and pool data
 Part of MultiCourtScore v2
 """
 
-from .core import VBLScraperBase, VBLMatch, ScanResult, ScraperConfig
+from .core import VBLScraperBase, VBLMatch, ScanResult, ScanSummary, ScraperConfig, PagePool, SharedBrowser
 from .bracket import BracketScraper
 from .pool import PoolScraper
 
@@ -14,7 +14,10 @@ __all__ = [
     'VBLScraperBase',
     'VBLMatch',
     'ScanResult', 
+    'ScanSummary',
     'ScraperConfig',
+    'PagePool',
+    'SharedBrowser',
     'BracketScraper',
     'PoolScraper'
 ]
@@ -16,6 +16,7 @@ from playwright.async_api import TimeoutError as PlaywrightTimeout
 from .core import (
     VBLScraperBase, 
     VBLMatch, 
+    PagePool, 
     ScanResult, 
     ScraperConfig,
     logger
@@ -29,8 +30,18 @@ class BracketScraper(VBLScraperBase):
       Phase 1: Find all match containers
       Phase 2: Click each container to open match card overlay
       Phase 3: Extract match data and API URL from overlay
+    
+    When started as the browser owner it also sets up a PagePool that the
+    CLI hands out to the per-URL scrapers; its pages open on first use.
     """
     
+    page_pool: Optional[PagePool] = None
+    
+    async def start(self):
+        """Initialize browser and the shared page pool"""
+        await super().start()
+        self.page_pool = PagePool(self.context, self.config.page_pool_size, self.config)
+    
     async def scan(
         self, 
         url: str, 
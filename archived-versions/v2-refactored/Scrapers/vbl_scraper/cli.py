@@ -8,14 +8,44 @@ Part of MultiCourtScore v2 - Consolidated scraper architecture
 
 import argparse
 import asyncio
+import concurrent.futures
+import functools
 import json
+import re
 import sys
 from pathlib import Path
 from typing import List, Optional
 
-from vbl_scraper.core import ScraperConfig, ScanResult, logger
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+from vbl_scraper.core import ScraperConfig, ScanResult, ScanSummary, logger
 from vbl_scraper.bracket import BracketScraper
 from vbl_scraper.pool import PoolScraper
+from vbl_scraper.teams import TeamsScraper, derive_teams_url
+
+
+# Page kind segment of a VBL URL, matched case-insensitively without lowering the URL
+URL_KIND_RE = re.compile(r'/(pools|brackets)/', re.IGNORECASE)
+
+# Threads for blocking filesystem work inside scan_urls, so disk access
+# never stalls the event loop driving the browser pages
+IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='vbl-io')
 
 
 async def scan_urls(
@@ -24,7 +54,7 @@ async def scan_urls(
     password: Optional[str] = None,
     headless: bool = True,
     output_file: Optional[Path] = None
-) -> List[ScanResult]:
+) -> ScanSummary:
     """
     Scan multiple URLs and return combined results.
     
@@ -36,7 +66,7 @@ async def scan_urls(
         output_file: Optional file to write results
         
     Returns:
-        List of ScanResult objects
+        ScanSummary over the ScanResult objects, in URL order
     """
     config = ScraperConfig(
         headless=headless,
@@ -44,93 +74,61 @@ async def scan_urls(
         results_file=output_file
     )
     
+    loop = asyncio.get_running_loop()
+    
     # Ensure config directory exists
-    config.session_file.parent.mkdir(parents=True, exist_ok=True)
+    await loop.run_in_executor(
+        IO_POOL, functools.partial(config.session_file.parent.mkdir, parents=True, exist_ok=True)
+    )
     
-    all_results = []
-    seed_cache = {}  # Cache for Teams tab seeds by division
+    # Slots are filled by index so results keep the order of the input URLs
+    all_results: List[Optional[ScanResult]] = [None] * len(urls)
+    seed_cache = {}  # Seed index (see _build_seed_index) per division
+    seed_tasks = {}  # Teams tab fetch task per division
+    semaphore = asyncio.Semaphore(config.max_concurrency)
     
-    # Use bracket scraper (which also handles login for pools)
-    async with BracketScraper(config) as scraper:
-        for i, url in enumerate(urls):
+    async def scan_one(scraper, i, url, teams_url):
+        async with semaphore:
             logger.info(f"\n[{i+1}/{len(urls)}] Processing: {url}")
             
-            # Determine if pool or bracket
-            if '/pools/' in url.lower():
-                # For pools, first try to get seeds from Teams tab
-                from .teams import TeamsScraper, derive_teams_url
-                
-                teams_url = derive_teams_url(url)
-                division_key = teams_url if teams_url else url
-                
-                if teams_url and division_key not in seed_cache:
-                    logger.info(f"  Fetching seeds from Teams tab: {teams_url}")
-                    teams_scraper = TeamsScraper(config)
-                    teams_scraper.playwright = scraper.playwright
-                    teams_scraper.browser = scraper.browser
-                    teams_scraper.context = scraper.context
-                    teams_scraper.page = await scraper.context.new_page()
-                    
-                    seeds = await teams_scraper.scan(teams_url, username, password)
-                    seed_cache[division_key] = seeds
-                    await teams_scraper.page.close()
-                    logger.info(f"  Cached {len(seeds)} team seeds for division")
-                elif teams_url and division_key in seed_cache:
-                    logger.info(f"  Using cached seeds ({len(seed_cache[division_key])} teams) - skipping Teams tab fetch")
-                
-                # Now scan the pool
-                pool_scraper = PoolScraper(config)
-                pool_scraper.playwright = scraper.playwright
-                pool_scraper.browser = scraper.browser
-                pool_scraper.context = scraper.context
-                pool_scraper.page = await scraper.context.new_page()
-                
-                result = await pool_scraper.scan(url, username, password)
-                await pool_scraper.page.close()
-                
-                # Merge seeds into results
-                cached_seeds = seed_cache.get(division_key, {})
-                if cached_seeds and result.matches:
-                    for match in result.matches:
-                        if not match.team1_seed and match.team1:
-                            match.team1_seed = _find_seed(match.team1, cached_seeds)
-                        if not match.team2_seed and match.team2:
-                            match.team2_seed = _find_seed(match.team2, cached_seeds)
-            else:
-                # For brackets, also try to use cached seeds
-                from .teams import TeamsScraper, derive_teams_url
-                
-                teams_url = derive_teams_url(url)
-                division_key = teams_url if teams_url else url
-                
-                # Check if we have cached seeds for this division
-                if teams_url and division_key not in seed_cache:
-                    logger.info(f"  Fetching seeds from Teams tab: {teams_url}")
-                    teams_scraper = TeamsScraper(config)
-                    teams_scraper.playwright = scraper.playwright
-                    teams_scraper.browser = scraper.browser
-                    teams_scraper.context = scraper.context
-                    teams_scraper.page = await scraper.context.new_page()
-                    
-                    seeds = await teams_scraper.scan(teams_url, username, password)
-                    seed_cache[division_key] = seeds
-                    await teams_scraper.page.close()
-                    logger.info(f"  Cached {len(seeds)} team seeds for division")
-                elif teams_url and division_key in seed_cache:
-                    logger.info(f"  Using cached seeds ({len(seed_cache[division_key])} teams) - skipping Teams tab fetch")
-                
-                result = await scraper.scan(url, username, password)
-                
-                # Merge seeds into bracket results too
-                cached_seeds = seed_cache.get(division_key, {})
-                if cached_seeds and result.matches:
-                    for match in result.matches:
-                        if not match.team1_seed and match.team1:
-                            match.team1_seed = _find_seed(match.team1, cached_seeds)
-                        if not match.team2_seed and match.team2:
-                            match.team2_seed = _find_seed(match.team2, cached_seeds)
+            # Determine if pool or bracket; each scan borrows its own pooled
+            # page so concurrent scans don't navigate each other away
+            kind = URL_KIND_RE.search(url)
+            scraper_cls = PoolScraper if kind and kind.group(1).lower() == 'pools' else BracketScraper
+            
+            # A failure is recorded as this URL's result instead of
+            # aborting the gather, and with it every other scan in flight
+            try:
+                async with scraper.page_pool.acquire() as page:
+                    url_scraper = scraper_cls.from_shared(config, scraper.shared, page)
+                    result = await url_scraper.scan(url, username, password)
+            except Exception as e:
+                result = ScanResult(url=url, status="error", error=str(e))
+            
+            # Merge seeds into results; the division's Teams fetch has been
+            # running alongside the scan and is only waited on here. Every
+            # scan of the division awaits the same task, so a failed fetch
+            # only costs the seeds
+            if teams_url:
+                try:
+                    await seed_tasks[teams_url]
+                except Exception as e:
+                    logger.warning(f"  Seed fetch failed for {teams_url}: {e}")
+            cached_seeds = seed_cache.get(teams_url)
+            if cached_seeds and result.matches:
+                # Only matches with a seed still to fill need a lookup
+                missing = [
+                    m for m in result.matches
+                    if (not m.team1_seed and m.team1) or (not m.team2_seed and m.team2)
+                ]
+                find = _find_seed
+                for match in missing:
+                    if not match.team1_seed and match.team1:
+                        match.team1_seed = find(match.team1, cached_seeds)
+                    if not match.team2_seed and match.team2:
+                        match.team2_seed = find(match.team2, cached_seeds)
             
-            all_results.append(result)
+            all_results[i] = result
             
             # Log summary
             if result.status == "success":
@@ -138,62 +136,172 @@ async def scan_urls(
             else:
                 logger.error(f"  Error: {result.error}")
     
+    # Use bracket scraper (which also handles login for pools) to own the browser
+    async with BracketScraper(config) as scraper:
+        # Start one Teams fetch per unique division up front; the fetches
+        # overlap with the pool/bracket scans instead of preceding them
+        teams_urls = [derive_teams_url(url) for url in urls]
+        for teams_url in set(teams_urls) - {None}:
+            seed_tasks[teams_url] = asyncio.create_task(
+                _ensure_seeds(teams_url, teams_url, scraper, seed_cache, username, password)
+            )
+        
+        await asyncio.gather(*(
+            scan_one(scraper, i, url, teams_urls[i])
+            for i, url in enumerate(urls)
+        ))
+    
+    summary = ScanSummary.from_results(all_results)
+    
     # Write results to file
     if output_file:
-        combined = {
-            'urls_scanned': len(urls),
-            'total_matches': sum(r.total_matches for r in all_results),
-            'results': [r.to_dict() for r in all_results],
-            'status': 'success' if all(r.status == 'success' for r in all_results) else 'partial'
-        }
-        
-        with open(output_file, 'w') as f:
-            json.dump(combined, f, indent=2)
-        
+        await loop.run_in_executor(IO_POOL, _write_results, output_file, urls, summary)
         logger.info(f"\nResults written to: {output_file}")
     
-    return all_results
+    return summary
 
 
-def _find_seed(team_name: str, seeds: dict) -> str | None:
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes, with orjson when it's installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _write_results(output_file: Path, urls: List[str], summary: ScanSummary):
+    """
+    Write the combined results file one result at a time, so the whole
+    tree is never held as a single dict or string.
+    """
+    with open(output_file, 'wb') as f:
+        f.write(b'{"urls_scanned":' + _dumps(len(urls)))
+        f.write(b',"total_matches":' + _dumps(summary.total_matches))
+        f.write(b',"results":[')
+        for i, result in enumerate(summary.results):
+            if i:
+                f.write(b',')
+            f.write(result.to_json_bytes())
+        f.write(b'],"status":' + _dumps(summary.status) + b'}')
+
+
+async def _ensure_seeds(
+    division_key: str,
+    teams_url: str,
+    scraper: BracketScraper,
+    seed_cache: dict,
+    username: Optional[str],
+    password: Optional[str]
+) -> None:
+    """Fetch a division's Teams tab seeds into seed_cache unless already cached"""
+    if division_key in seed_cache:
+        return
+    
+    logger.info(f"Fetching seeds from Teams tab: {teams_url}")
+    async with scraper.page_pool.acquire() as page:
+        teams_scraper = TeamsScraper.from_shared(scraper.config, scraper.shared, page)
+        seeds = await teams_scraper.scan(teams_url, username, password)
+    seed_cache[division_key] = _build_seed_index(seeds)
+    logger.info(f"Cached {len(seeds)} team seeds for {teams_url}")
+
+
+def _build_seed_index(seeds: dict) -> dict | None:
+    """
+    Precompute the lookup tables _find_seed needs, once per division.
+    Returns None when the division has no seeds.
+    """
+    if not seeds:
+        return None
+    
+    lower_items = [(k.lower(), v) for k, v in seeds.items()]
+    
+    # One automaton over every seed name finds all the seed names inside a
+    # team name in a single scan; values are positions in lower_items
+    matcher = None
+    if AHOCORASICK_AVAILABLE:
+        matcher = ahocorasick.Automaton()
+        for i, (seed_lower, _) in enumerate(lower_items):
+            if not matcher.exists(seed_lower):
+                matcher.add_word(seed_lower, i)
+        matcher.make_automaton()
+    
+    return {
+        'exact': seeds,
+        'norm': {' '.join(k.split()): v for k, v in seeds.items()},
+        'lower_items': lower_items,
+        'matcher': matcher
+    }
+
+
+def _find_seed(team_name: str, cached: dict) -> str | None:
     """
     Find seed for a team name, handling partial matches.
     Team names might be "FirstName LastName / FirstName LastName" format.
+    
+    cached is a seed index from _build_seed_index.
     """
-    if not team_name or not seeds:
+    if not team_name or not cached:
         return None
     
     # Exact match
-    if team_name in seeds:
-        return seeds[team_name]
+    seed = cached['exact'].get(team_name)
+    if seed is not None:
+        return seed
     
     # Normalize and try again
-    normalized = ' '.join(team_name.split()).strip()
-    if normalized in seeds:
-        return seeds[normalized]
+    seed = cached['norm'].get(' '.join(team_name.split()))
+    if seed is not None:
+        return seed
     
     # Partial match - check if any seed key is contained in team name or vice versa
     team_lower = team_name.lower()
-    for seed_team, seed_num in seeds.items():
-        if seed_team.lower() in team_lower or team_lower in seed_team.lower():
+    lower_items = cached['lower_items']
+    matcher = cached['matcher']
+    
+    if matcher is None:
+        for seed_lower, seed_num in lower_items:
+            if seed_lower in team_lower or team_lower in seed_lower:
+                return seed_num
+        return None
+    
+    # First seed (in table order) contained in the team name, then only the
+    # seeds before it need the reverse check to keep the same answer
+    first = min((i for _, i in matcher.iter(team_lower)), default=len(lower_items))
+    for seed_lower, seed_num in lower_items[:first]:
+        if team_lower in seed_lower:
             return seed_num
     
-    return None
+    return lower_items[first][1] if first < len(lower_items) else None
+
+
+CREDENTIALS_FILE = Path.home() / 'Library' / 'Application Support' / 'MultiCourtScore' / 'credentials.json'
 
 
 def load_credentials() -> tuple:
     """Load credentials from config file"""
-    creds_file = Path.home() / 'Library' / 'Application Support' / 'MultiCourtScore' / 'credentials.json'
-    
-    if creds_file.exists():
-        try:
-            with open(creds_file) as f:
-                data = json.load(f)
-            return data.get('username', ''), data.get('password', '')
-        except Exception:
-            pass
+    try:
+        mtime = CREDENTIALS_FILE.stat().st_mtime
+    except OSError:
+        return None, None
     
-    return None, None
+    return _read_credentials(CREDENTIALS_FILE, mtime)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_credentials(creds_file: Path, mtime: float) -> tuple:
+    """Parse the credentials file; mtime is part of the cache key so edits are picked up"""
+    try:
+        with open(creds_file) as f:
+            data = json.load(f)
+        return data.get('username', ''), data.get('password', '')
+    except Exception:
+        return None, None
+
+
+def _run(coro):
+    """asyncio.run, on uvloop's event loop when it's installed"""
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
 
 
 def main():
@@ -294,14 +402,14 @@ Examples:
                         print("No credentials available")
                         return 1
         
-        sys.exit(asyncio.run(check_login()))
+        sys.exit(_run(check_login()))
     
     # Require URLs for scanning
     if not args.urls:
         parser.error("No URLs provided. Use --help for usage.")
     
     # Run scan
-    results = asyncio.run(scan_urls(
+    summary = _run(scan_urls(
         urls=args.urls,
         username=username,
         password=password,
@@ -310,18 +418,15 @@ Examples:
     ))
     
     # Print summary
-    total_matches = sum(r.total_matches for r in results)
-    successful = sum(1 for r in results if r.status == 'success')
-    
     print(f"\n{'='*50}")
-    print(f"Scan Complete: {successful}/{len(results)} URLs successful")
-    print(f"Total Matches Found: {total_matches}")
+    print(f"Scan Complete: {summary.successes}/{len(summary.results)} URLs successful")
+    print(f"Total Matches Found: {summary.total_matches}")
     print(f"Results: {args.output}")
     print(f"{'='*50}")
     
     # Return success (0) if we found any matches, otherwise 1
     # This prevents false "error" warnings when matches were found
-    sys.exit(0 if total_matches > 0 else 1)
+    sys.exit(0 if summary.total_matches > 0 else 1)
 
 
 if __name__ == '__main__':
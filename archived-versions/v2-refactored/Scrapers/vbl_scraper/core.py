@@ -7,17 +7,27 @@ Part of MultiCourtScore v2 - Complete rewrite based on v1 proven patterns
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
+import re
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
 
-# Configure logging
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Configure logging; basicConfig does nothing if the importing application
+# has already configured the root logger
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
@@ -25,22 +35,109 @@ logging.basicConfig(
 )
 logger = logging.getLogger('vbl_scraper')
 
+# Chromium subsystems a headless scraper never uses. --no-sandbox is left
+# out on purpose; add it via ScraperConfig.chromium_args in containers.
+DEFAULT_CHROMIUM_ARGS = (
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--metrics-recording-only',
+    '--no-first-run',
+    '--mute-audio',
+)
+
+CONTEXT_OPTIONS = {
+    'viewport': {'width': 1400, 'height': 900},
+    'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
 
-@dataclass
+VBL_HOME_URL = 'https://volleyballlife.com'
+V3_SWITCH_SELECTOR = 'button:has-text("SWITCH TO V3 VIEW")'
+# Present once the header has rendered, signed out or signed in
+HEADER_READY_SELECTOR = 'button:has-text("Sign In"), [class*="avatar"]'
+
+# Visible signed-in indicators, one locator instead of a probe per selector
+LOGGED_IN_SELECTOR = '[class*="avatar"]:visible, button:has-text("Logout"):visible, a:has-text("Profile"):visible'
+LOGIN_CONFIRMED_SELECTOR = '[class*="profile"]:visible, [class*="avatar"]:visible, button:has-text("Logout"):visible'
+
+# Any visible, enabled sign-in email input, search boxes excluded
+EMAIL_FIELD_SELECTOR = ', '.join(
+    f'{base}:not([placeholder*="search" i]):not([aria-label*="search" i]):visible:enabled'
+    for base in (
+        'div.v-card input[type="text"]',
+        'input[aria-label*="email" i]',
+        'input[placeholder*="email" i]',
+        'div.v-field input[type="text"]',
+    )
+)
+# Final Sign In button, most specific first; the header's own Sign In
+# button precedes the modal in the DOM, so these stay a priority list
+FINAL_SIGNIN_SELECTORS = (
+    'div.v-card button:has-text("Sign In"):visible:enabled',
+    'button.v-btn:has-text("Sign In"):visible:enabled',
+    'button:has-text("Sign In"):visible:enabled',
+)
+
+# Parenthetical data after a name, e.g. "(FR 52nd)"
+PAREN_RE = re.compile(r'\s*\([^)]*\)\s*')
+POOL_NUM_RE = re.compile(r'/pools/(\d+)')
+
+# Every match format phrase in one pattern, applied to the lowercased
+# v-alert text. Phrases overlap ("2 sets to 21" holds "to 21", "cap 23"
+# holds a number that may start "23 sets"), so alternatives never consume
+# a number or phrase another alternative could start at; those parts are
+# matched in lookaheads and the scan picks them up on the same pass.
+FORMAT_RE = re.compile(
+    r'(?P<no_cap>no cap|win by (?=2))'
+    r'|best\s*of\s*(?=(?P<best_of>\d+))'  # "best of 3"
+    r'|(?P<sets_to_win>\d+)\s*sets?\s*to\s*(?=win)'  # "2 sets to win"
+    r'|(?P<sets_to_points>\d+)\s*sets?\s+(?=to\s+\d)'  # "1 set to 28"
+    r'|(?P<sets_bare>\d+)\s*sets?(?!\s*to)'  # "3 sets"
+    r'|(?P<points_per>\d+)\s*(?:point|pt)s?\s+(?:per\s+)?set'  # "21 points per set"
+    r'|(?P<cap>\d+)\s*(?:point\s*)?cap'  # "21 point cap", "23 cap"
+    r'|to\s+(?=(?P<points_to>\d+))'  # "to 21", "played to 21"
+    r'|cap\s*(?:of\s*)?(?=(?P<cap_of>\d+))'  # "cap of 23", "cap 23"
+    r'|capped\s*(?:at\s*)?(?=(?P<capped_at>\d+))'  # "capped at 23"
+)
+
+# Analytics/ad hosts whose requests are never needed for scraping
+TRACKER_HOSTS_RE = re.compile(
+    r'^https?://(?:[^/]*\.)?(?:googletagmanager\.com|google-analytics\.com|doubleclick\.net'
+    r'|googlesyndication\.com|facebook\.net|hotjar\.com)(?:[:/]|$)'
+)
+
+
+@dataclass(slots=True)
 class ScraperConfig:
     """Configuration for the VBL scraper"""
     headless: bool = True
-    timeout: int = 30000
+    timeout: int = 30000  # Navigation budget (goto, reload)
+    action_timeout: int = 5000  # Locator lookups and actions; a miss costs this long
     session_file: Optional[Path] = None
     results_file: Optional[Path] = None
     slow_mo: int = 0  # Milliseconds to slow down operations
+    max_concurrency: int = 8  # URLs scanned at once, each on its own page
+    page_pool_size: int = 8  # Pages kept open for reuse across scans
+    match_concurrency: int = 3  # Cards on one pool page read at once
+    # Request resource types aborted before download; visibility checks
+    # depend on CSS, so stylesheets are only blocked if added here
+    block_resources: Set[str] = field(default_factory=lambda: {'image', 'font', 'media'})
+    # Extra Chromium switches; trims startup and per-page memory
+    chromium_args: List[str] = field(default_factory=lambda: list(DEFAULT_CHROMIUM_ARGS))
     
     def __post_init__(self):
         if self.session_file is None:
             self.session_file = Path.home() / '.multicourtscore' / 'session.json'
+    
+    def apply_timeouts(self, page: Page):
+        """Long budget for navigation, short default for everything else"""
+        page.set_default_navigation_timeout(self.timeout)
+        page.set_default_timeout(self.action_timeout)
 
 
-@dataclass 
+@dataclass(slots=True)
 class VBLMatch:
     """Represents a single match from VBL"""
     index: int
@@ -61,6 +158,8 @@ class VBLMatch:
     point_cap: Optional[int] = None  # Point cap (e.g., 23), None means win by 2
     format_text: Optional[str] = None  # Raw format text from page
     
+    # Spelled out rather than dataclasses.asdict + key renames: asdict
+    # deep-copies every value and is ~30x slower per match
     def to_dict(self) -> Dict[str, Any]:
         return {
             'index': self.index,
@@ -82,7 +181,7 @@ class VBLMatch:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     """Result of scanning a VBL URL"""
     url: str
@@ -92,6 +191,7 @@ class ScanResult:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     match_type: Optional[str] = None
     type_detail: Optional[str] = None
+    login_performed: bool = False  # True if this scan had to log in
     
     @property
     def total_matches(self) -> int:
@@ -108,6 +208,93 @@ class ScanResult:
             'match_type': self.match_type,
             'type_detail': self.type_detail
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Compact JSON for to_dict(), serialized by orjson when it's installed"""
+        data = self.to_dict()
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data)
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+@dataclass
+class ScanSummary:
+    """Totals over a batch of ScanResults, computed in one pass"""
+    results: List[ScanResult]
+    total_matches: int = 0
+    successes: int = 0
+    
+    @classmethod
+    def from_results(cls, results: List[ScanResult]) -> 'ScanSummary':
+        summary = cls(results)
+        for r in results:
+            summary.total_matches += r.total_matches
+            summary.successes += r.status == 'success'
+        return summary
+    
+    @property
+    def status(self) -> str:
+        return 'success' if self.successes == len(self.results) else 'partial'
+
+
+@dataclass(slots=True)
+class SharedBrowser:
+    """Playwright handles owned by one scraper and lent to others"""
+    playwright: Any
+    browser: Browser
+    context: BrowserContext
+
+
+class PagePool:
+    """
+    Up to `size` pages on one browser context, handed out one at a time.
+    Pages are opened on first demand, so runs that never borrow one never
+    open one, and parked on about:blank between uses instead of being closed.
+    """
+    
+    def __init__(self, context: BrowserContext, size: int, config: ScraperConfig):
+        self.context = context
+        self.size = size
+        self.config = config
+        self._pages: asyncio.Queue = asyncio.Queue()
+        self._opened = 0  # Pages opened so far, idle or lent out
+    
+    async def _new_page(self) -> Page:
+        page = await self.context.new_page()
+        self.config.apply_timeouts(page)
+        return page
+    
+    async def _open_page(self) -> Page:
+        """Open one more pool page, counting it before the await"""
+        self._opened += 1
+        try:
+            return await self._new_page()
+        except Exception:
+            self._opened -= 1
+            raise
+    
+    async def fill(self):
+        """Open the pool's remaining pages up front"""
+        while self._opened < self.size:
+            self._pages.put_nowait(await self._open_page())
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a page, opening one while below size; it goes back to the pool on exit"""
+        if self._pages.empty() and self._opened < self.size:
+            page = await self._open_page()
+        else:
+            page = await self._pages.get()
+        try:
+            if page.is_closed():
+                page = await self._new_page()
+            yield page
+        finally:
+            try:
+                await page.goto('about:blank')
+            except Exception as e:
+                logger.debug("Could not reset pooled page: %s", e)
+            self._pages.put_nowait(page)
 
 
 class VBLScraperBase:
@@ -117,6 +304,8 @@ class VBLScraperBase:
     
     # Class-level flag to track if we've logged in during this session
     _session_logged_in = False
+    # Serializes login so concurrent scans don't all fill in the modal at once
+    _login_lock = asyncio.Lock()
     
     def __init__(self, config: Optional[ScraperConfig] = None):
         self.config = config or ScraperConfig()
@@ -125,6 +314,22 @@ class VBLScraperBase:
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self._captured_api_urls: List[str] = []
+        self._captured_api_set: Set[str] = set()  # membership for _captured_api_urls
+    
+    @classmethod
+    def from_shared(cls, config: ScraperConfig, shared: SharedBrowser, page: Page) -> 'VBLScraperBase':
+        """Build a scraper that works on another scraper's browser and a lent page"""
+        scraper = cls(config)
+        scraper.playwright = shared.playwright
+        scraper.browser = shared.browser
+        scraper.context = shared.context
+        scraper.page = page
+        return scraper
+    
+    @property
+    def shared(self) -> SharedBrowser:
+        """This scraper's browser handles, for from_shared"""
+        return SharedBrowser(self.playwright, self.browser, self.context)
     
     async def __aenter__(self):
         await self.start()
@@ -140,49 +345,85 @@ class VBLScraperBase:
         
         self.browser = await self.playwright.chromium.launch(
             headless=self.config.headless,
-            slow_mo=self.config.slow_mo
+            slow_mo=self.config.slow_mo,
+            args=self.config.chromium_args
         )
         
-        self.context = await self.browser.new_context(
-            viewport={'width': 1400, 'height': 900},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        )
+        # Reuse the cookies/storage saved by the last run so login can be skipped
+        session_file = self.config.session_file
+        if session_file and session_file.exists():
+            try:
+                self.context = await self.browser.new_context(
+                    storage_state=str(session_file), **CONTEXT_OPTIONS
+                )
+                logger.info("Restored session from %s", session_file)
+            except Exception as e:
+                logger.warning("Ignoring unreadable session file: %s", e)
         
-        self.page = await self.context.new_page()
-        self.page.set_default_timeout(self.config.timeout)
+        if not self.context:
+            self.context = await self.browser.new_context(**CONTEXT_OPTIONS)
+        
+        # Capture API URLs and skip downloads the scraper never looks at;
+        # applies to every page on the context, including pooled ones
+        await self.context.route('**/*', self._route_filter)
         
-        # Set up network request interception for API URL capture
-        self.page.on('request', self._capture_api_requests)
+        self.page = await self.context.new_page()
+        self.config.apply_timeouts(self.page)
         
         logger.info("Browser started successfully")
     
     async def close(self):
-        """Clean up browser"""
+        """Clean up browser, saving the session for the next run"""
+        if self.context and self.config.session_file and VBLScraperBase._session_logged_in:
+            try:
+                self.config.session_file.parent.mkdir(parents=True, exist_ok=True)
+                await self.context.storage_state(path=str(self.config.session_file))
+            except Exception as e:
+                logger.warning("Could not save session: %s", e)
+        
         if self.browser:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
         logger.info("Browser closed")
     
-    def _capture_api_requests(self, request):
-        """Capture API URLs from network requests"""
+    async def _route_filter(self, route):
+        """
+        Single request hook: record vMix API URLs, abort blocked resource
+        types and tracker requests, continue the rest.
+        
+        API requests are never blocked so the page's data still loads.
+        """
+        request = route.request
         url = request.url
-        if 'api.volleyballlife.com' in url and '/vmix' in url:
-            if url not in self._captured_api_urls:
+        if 'api.volleyballlife.com' in url:
+            if '/vmix' in url and url not in self._captured_api_set:
+                self._captured_api_set.add(url)
                 self._captured_api_urls.append(url)
-                logger.debug(f"Captured API URL: {url}")
+                logger.debug("Captured API URL: %s", url)
+            await route.continue_()
+        elif request.resource_type in self.config.block_resources or TRACKER_HOSTS_RE.match(url):
+            await route.abort()
+        else:
+            await route.continue_()
     
-    def clean_team_name(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def clean_team_name(name: str) -> str:
         """
         Clean team name by removing freeze points rankings and other parenthetical data.
         e.g., "Kevin Coyle (FR 52nd)" -> "Kevin Coyle"
+        
+        Cached: the same players recur across pools and bracket rounds.
         """
-        import re
         if not name:
             return name
         
+        if '(' not in name:
+            return ' '.join(name.split())
+        
         # Remove anything in parentheses (freeze points, rankings, etc.)
-        cleaned = re.sub(r'\s*\([^)]*\)\s*', ' ', name)
+        cleaned = PAREN_RE.sub(' ', name)
         
         # Remove extra whitespace
         cleaned = ' '.join(cleaned.split())
@@ -200,7 +441,6 @@ class VBLScraperBase:
         - "Rally scoring to 28"
         Returns dict with sets_to_win, points_per_set, point_cap, format_text
         """
-        import re
         result = {
             'sets_to_win': 2,  # Default: best of 3
             'points_per_set': 21,
@@ -209,93 +449,64 @@ class VBLScraperBase:
         }
         
         try:
-            # Look for v-alert content which contains format info
-            selector = 'div.v-alert__content'
-            element = self.page.locator(selector).first
+            # Look for v-alert content which contains format info; count()
+            # answers at once on the many pages that have none
+            locator = self.page.locator('div.v-alert__content')
+            if not await locator.count():
+                return result
             
-            if await element.is_visible():
-                text = await element.text_content()
-                result['format_text'] = text.strip() if text else None
-                
-                if text:
-                    text_lower = text.lower()
-                    
-                    # ========== PARSE SETS TO WIN ==========
-                    # Pattern: "X set(s)" where X is a number
-                    # "1 set" = 1 set to win
-                    # "2 sets" = 2 sets (could be 2 total or 2 to win)
-                    # "3 sets" = 3 sets total (typically 2 to win)
-                    # "best of 3" = 2 to win
-                    # "best of 5" = 3 to win
-                    
-                    # Check for "best of X" pattern first
-                    best_of_match = re.search(r'best\s*of\s*(\d+)', text_lower)
-                    if best_of_match:
-                        total_sets = int(best_of_match.group(1))
-                        result['sets_to_win'] = (total_sets // 2) + 1
-                    else:
-                        # Check for "X set(s) to win"
-                        sets_to_win_match = re.search(r'(\d+)\s*sets?\s*to\s*win', text_lower)
-                        if sets_to_win_match:
-                            result['sets_to_win'] = int(sets_to_win_match.group(1))
-                        else:
-                            # Check for "X set(s) to Y" pattern (e.g., "1 set to 28", "2 sets to 21")
-                            # This captures both the number of sets AND indicates there's a point target
-                            set_to_points_match = re.search(r'(\d+)\s*sets?\s+to\s+\d+', text_lower)
-                            if set_to_points_match:
-                                num_sets = int(set_to_points_match.group(1))
-                                if num_sets == 1:
-                                    result['sets_to_win'] = 1
-                                elif num_sets == 2:
-                                    result['sets_to_win'] = 2
-                                elif num_sets >= 3:
-                                    result['sets_to_win'] = (num_sets // 2) + 1
-                            else:
-                                # Check for simple "X set(s)" pattern (not followed by "to")
-                                sets_match = re.search(r'(\d+)\s*sets?(?!\s*to)', text_lower)
-                                if sets_match:
-                                    num_sets = int(sets_match.group(1))
-                                    if num_sets == 1:
-                                        result['sets_to_win'] = 1
-                                    elif num_sets == 2:
-                                        result['sets_to_win'] = 2
-                                    elif num_sets >= 3:
-                                        result['sets_to_win'] = (num_sets // 2) + 1
-                    
-                    # ========== PARSE POINTS PER SET ==========
-                    # Look for patterns like "to 21", "to 25", "to 15", "played to 21"
-                    # Also handle "sets to 21" vs "3rd set to 15"
-                    points_patterns = [
-                        r'(?:played?\s*)?to\s+(\d+)',  # "to 21", "played to 21"
-                        r'sets?\s+to\s+(\d+)',  # "sets to 21"
-                        r'(\d+)\s*(?:point|pt)s?\s+(?:per\s+)?set',  # "21 points per set"
-                    ]
-                    for pattern in points_patterns:
-                        match = re.search(pattern, text_lower)
-                        if match:
-                            result['points_per_set'] = int(match.group(1))
-                            break
-                    
-                    # ========== PARSE POINT CAP ==========
-                    # Look for patterns like "21 point cap", "cap 23", "23 cap", "no cap"
-                    if 'no cap' in text_lower or 'win by 2' in text_lower:
-                        result['point_cap'] = None  # No cap, win by 2
-                    else:
-                        cap_patterns = [
-                            r'(\d+)\s*(?:point\s*)?cap',  # "21 point cap", "23 cap"
-                            r'cap\s*(?:of\s*)?(\d+)',  # "cap of 23", "cap 23"
-                            r'capped\s*(?:at\s*)?(\d+)',  # "capped at 23"
-                        ]
-                        for pattern in cap_patterns:
-                            match = re.search(pattern, text_lower)
-                            if match:
-                                result['point_cap'] = int(match.group(1))
-                                break
-                    
-                    logger.info(f"Match format detected: {result['sets_to_win']} set(s) to win, to {result['points_per_set']}, cap {result['point_cap']} | Raw: {text.strip()}")
-        
+            text = await locator.first.text_content()
+            if not text:
+                return result
+            
+            stripped = text.strip()
+            result['format_text'] = stripped
+            text_lower = stripped.lower()
+            
+            # One pass collects the first occurrence of each phrase;
+            # the precedence between phrases is applied below
+            found = {}
+            for m in FORMAT_RE.finditer(text_lower):
+                found.setdefault(m.lastgroup, m.group(m.lastgroup))
+            
+            # ========== PARSE SETS TO WIN ==========
+            # "best of 3" = 2 to win, "best of 5" = 3 to win
+            # "X set(s) to win" = X to win
+            # "X set(s) to Y" or bare "X set(s)": 1 and 2 are taken
+            # as sets to win, 3 or more as a best-of total
+            if 'best_of' in found:
+                result['sets_to_win'] = (int(found['best_of']) // 2) + 1
+            elif 'sets_to_win' in found:
+                result['sets_to_win'] = int(found['sets_to_win'])
+            else:
+                num_sets = found.get('sets_to_points') or found.get('sets_bare')
+                if num_sets:
+                    num_sets = int(num_sets)
+                    if num_sets in (1, 2):
+                        result['sets_to_win'] = num_sets
+                    elif num_sets >= 3:
+                        result['sets_to_win'] = (num_sets // 2) + 1
+            
+            # ========== PARSE POINTS PER SET ==========
+            # "to 21" anywhere wins over "21 points per set"
+            points = found.get('points_to') or found.get('points_per')
+            if points:
+                result['points_per_set'] = int(points)
+            
+            # ========== PARSE POINT CAP ==========
+            # "no cap" / "win by 2" anywhere means no cap
+            if 'no_cap' not in found:
+                cap = found.get('cap') or found.get('cap_of') or found.get('capped_at')
+                if cap:
+                    result['point_cap'] = int(cap)
+            
+            logger.info(
+                "Match format detected: %s set(s) to win, to %s, cap %s | Raw: %s",
+                result['sets_to_win'], result['points_per_set'], result['point_cap'], stripped
+            )
+
         except Exception as e:
-            logger.warning(f"Could not extract match format: {e}")
+            logger.warning("Could not extract match format: %s", e)
         
         return result
     
@@ -304,29 +515,16 @@ class VBLScraperBase:
     async def check_login_status(self) -> bool:
         """Check if already logged in by looking for profile indicators"""
         try:
-            # Look for user profile indicators
-            profile_selectors = [
-                '[class*="avatar"]',
-                'button:has-text("Logout")',
-                'a:has-text("Profile")'
-            ]
-            
-            for selector in profile_selectors:
-                try:
-                    if await self.page.is_visible(selector):
-                        logger.info(f"Found logged-in indicator: {selector}")
-                        return True
-                except Exception:
-                    continue
+            # Look for user profile indicators; anything else (including a
+            # visible Sign In button) means not logged in
+            if await self.page.locator(LOGGED_IN_SELECTOR).count():
+                logger.info("Found logged-in indicator")
+                return True
             
-            # Look for Sign In button - means not logged in
-            if await self.page.is_visible('button:has-text("Sign In")'):
-                return False
-                
             return False
             
         except Exception as e:
-            logger.warning(f"Error checking login status: {e}")
+            logger.warning("Error checking login status: %s", e)
             return False
     
     async def phase_1_initial_setup(self):
@@ -335,22 +533,29 @@ class VBLScraperBase:
         """
         logger.info("PHASE 1: Initial setup and V3 view check")
         
-        await self.page.goto('https://volleyballlife.com')
-        await self.page.wait_for_load_state('networkidle')
+        await self.page.goto(VBL_HOME_URL, wait_until='domcontentloaded')
+        
+        # Return as soon as the app has rendered whichever header it's
+        # going to show, rather than waiting for the network to go quiet
+        try:
+            await self.page.wait_for_selector(
+                f'{V3_SWITCH_SELECTOR}, {HEADER_READY_SELECTOR}', timeout=10000
+            )
+        except Exception as e:
+            logger.warning("Home page header not seen: %s", e)
         
         # Check for V3 switch button
         try:
-            v3_selector = 'button:has-text("SWITCH TO V3 VIEW")'
+            v3_selector = V3_SWITCH_SELECTOR
             if await self.page.is_visible(v3_selector):
                 logger.info("Found V3 switch button - clicking...")
                 await self.page.click(v3_selector)
-                await self.page.wait_for_load_state('networkidle')
-                await asyncio.sleep(1.2)
+                await self.page.wait_for_selector(HEADER_READY_SELECTOR, timeout=10000)
                 logger.info("Switched to V3 view")
             else:
                 logger.info("Already in V3 view")
         except Exception as e:
-            logger.warning(f"V3 switch check: {e}")
+            logger.warning("V3 switch check: %s", e)
     
     async def phase_2_open_signin_modal(self) -> bool:
         """
@@ -372,7 +577,7 @@ class VBLScraperBase:
             return True
             
         except Exception as e:
-            logger.error(f"Phase 2 failed: {e}")
+            logger.error("Phase 2 failed: %s", e)
             return False
     
     async def phase_3_enter_credentials(self, username: str, password: str) -> bool:
@@ -385,77 +590,30 @@ class VBLScraperBase:
         logger.info("PHASE 3: Entering credentials")
         
         try:
-            # Wait for modal to fully load
-            await asyncio.sleep(1.0)
-            
+            # The email field's wait_for below gates on the modal being ready
             # Step 1: Find the email field in the SIGN IN section
             # The modal structure typically has the sign-in section first
             logger.info("Step 1: Looking for sign-in email field...")
             
-            # Try to find the email input - typically the first text input in the modal
-            # that's not in a "create account" section
-            email_field = None
-            
-            # Strategy 1: Look for input near "Sign In" text
+            # One locator covers every way the field has been found; it
+            # resolves to the first match in the modal
+            email_field = self.page.locator(EMAIL_FIELD_SELECTOR).first
             try:
-                # Find all text inputs in the modal card
-                all_inputs = await self.page.locator('div.v-card input[type="text"]').all()
-                
-                for input_elem in all_inputs:
-                    if await input_elem.is_visible() and await input_elem.is_enabled():
-                        # Get placeholder to verify it's an email field
-                        placeholder = await input_elem.get_attribute('placeholder') or ""
-                        aria_label = await input_elem.get_attribute('aria-label') or ""
-                        
-                        # Skip search boxes
-                        if 'search' in placeholder.lower() or 'search' in aria_label.lower():
-                            continue
-                        
-                        # Check if this input is likely the sign-in email field
-                        # It should be the first visible email-type input
-                        email_field = input_elem
-                        logger.info(f"Found email field (placeholder: {placeholder})")
-                        break
-                        
-            except Exception as e:
-                logger.warning(f"Strategy 1 failed: {e}")
-            
-            # Strategy 2: Use more specific selectors
-            if not email_field:
-                email_selectors = [
-                    'input[aria-label*="email" i]',
-                    'input[placeholder*="email" i]',
-                    'div.v-field input[type="text"]'
-                ]
-                
-                for selector in email_selectors:
-                    try:
-                        elements = await self.page.locator(selector).all()
-                        for elem in elements:
-                            if await elem.is_visible() and await elem.is_enabled():
-                                email_field = elem
-                                logger.info(f"Found email field with: {selector}")
-                                break
-                        if email_field:
-                            break
-                    except Exception:
-                        continue
-            
-            if not email_field:
+                await email_field.wait_for(state='visible', timeout=5000)
+            except Exception:
                 logger.error("Could not find email input field")
                 return False
             
-            # Enter the email
-            await email_field.click()  # Focus the field first
-            await asyncio.sleep(0.3)
+            logger.info("Found email field")
+            
+            # Enter the email (fill focuses the field itself)
             await email_field.fill(username)
-            logger.info(f"Entered email: {username}")
+            logger.info("Entered email: %s", username)
             
             # Step 2: Click Continue button
             logger.info("Step 2: Clicking Continue...")
-            await asyncio.sleep(0.5)
             
-            # Find and click Continue button
+            # Find and click Continue button; click() waits until it's enabled
             continue_btn = self.page.locator('button:has-text("Continue")').first
             await continue_btn.click()
             logger.info("Clicked Continue")
@@ -468,31 +626,28 @@ class VBLScraperBase:
             
             # Step 4: Enter password
             logger.info("Step 4: Entering password...")
-            await asyncio.sleep(0.3)
             await self.page.fill(password_selector, password)
             logger.info("Password entered")
             
-            # Small delay to let form process
-            await asyncio.sleep(0.8)
+            # Let the form enable its Sign In button before probing for it
+            try:
+                await self.page.locator(FINAL_SIGNIN_SELECTORS[0]).first.wait_for(
+                    state='visible', timeout=3000
+                )
+            except Exception:
+                pass
             
             # Step 5: Click final Sign In button
             logger.info("Step 5: Clicking final Sign In...")
             
             # The Sign In button should be visible now
-            final_signin_selectors = [
-                'div.v-card button:has-text("Sign In")',
-                'button.v-btn:has-text("Sign In")',
-                'button:has-text("Sign In"):visible'
-            ]
-            
-            for selector in final_signin_selectors:
+            for selector in FINAL_SIGNIN_SELECTORS:
                 try:
-                    buttons = await self.page.locator(selector).all()
-                    for btn in buttons:
-                        if await btn.is_visible() and await btn.is_enabled():
-                            await btn.click()
-                            logger.info(f"Clicked Sign In button")
-                            return True
+                    btn = self.page.locator(selector).first
+                    if await btn.count():
+                        await btn.click()
+                        logger.info("Clicked Sign In button")
+                        return True
                 except Exception:
                     continue
             
@@ -502,7 +657,7 @@ class VBLScraperBase:
             return True
             
         except Exception as e:
-            logger.error(f"Phase 3 failed: {e}")
+            logger.error("Phase 3 failed: %s", e)
             return False
     
     async def phase_4_confirm_login(self) -> bool:
@@ -519,27 +674,18 @@ class VBLScraperBase:
                 timeout=15000
             )
             logger.info("Login confirmed - Sign In button disappeared")
-            
-            await asyncio.sleep(1.2)
             return True
             
         except Exception as e:
-            logger.warning(f"Phase 4 timeout: {e}")
+            logger.warning("Phase 4 timeout: %s", e)
             
             # Try alternative confirmation
-            profile_selectors = [
-                '[class*="profile"]',
-                '[class*="avatar"]',
-                'button:has-text("Logout")'
-            ]
-            
-            for selector in profile_selectors:
-                try:
-                    if await self.page.is_visible(selector):
-                        logger.info(f"Found profile indicator: {selector}")
-                        return True
-                except Exception:
-                    continue
+            try:
+                if await self.page.locator(LOGIN_CONFIRMED_SELECTOR).count():
+                    logger.info("Found profile indicator")
+                    return True
+            except Exception:
+                pass
             
             return False
     
@@ -548,6 +694,11 @@ class VBLScraperBase:
         Complete 4-phase login process.
         Uses session-level flag to avoid redundant login attempts.
         """
+        async with VBLScraperBase._login_lock:
+            return await self._login(username, password)
+    
+    async def _login(self, username: str, password: str) -> bool:
+        """Login body; callers hold _login_lock"""
         # Check if we've already logged in during this session
         if VBLScraperBase._session_logged_in:
             logger.info("Already logged in this session - skipping login")
@@ -574,6 +725,9 @@ class VBLScraperBase:
         
         # Phase 4
         if not await self.phase_4_confirm_login():
+            # Whatever session was saved didn't get us in; don't restore it again
+            if self.config.session_file:
+                self.config.session_file.unlink(missing_ok=True)
             return False
         
         VBLScraperBase._session_logged_in = True
@@ -582,13 +736,14 @@ class VBLScraperBase:
     
     # ==================== URL TYPE DETECTION ====================
     
-    def determine_url_type(self, url: str) -> tuple:
-        """Determine match type from URL"""
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def determine_url_type(url: str) -> tuple:
+        """Determine match type from URL (cached; a pure function of the URL)"""
         url_lower = url.lower()
         
         if '/pools/' in url_lower:
-            import re
-            pool_match = re.search(r'/pools/(\d+)', url_lower)
+            pool_match = POOL_NUM_RE.search(url_lower)
             pool_num = pool_match.group(1) if pool_match else "Unknown"
             return "Pool Play", f"Pool {pool_num}"
         elif '/brackets/' in url_lower:
@@ -608,3 +763,43 @@ class VBLScraperBase:
         Scan a VBL URL for matches - to be implemented by subclasses
         """
         raise NotImplementedError("Subclasses must implement scan()")
+    
+    async def scan_many(
+        self,
+        urls: List[str],
+        concurrency: int = 4,
+        username: str = None,
+        password: str = None
+    ) -> List[ScanResult]:
+        """
+        Scan several URLs at once on this scraper's browser.
+        
+        Logs in once here, then gives each URL its own context seeded with
+        this context's storage state, so the scans share the login but not
+        pages, cookie jars or captured API URLs.
+        
+        Returns:
+            ScanResults in the same order as urls
+        """
+        if username and password:
+            await self.login(username, password)
+        state = await self.context.storage_state()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def scan_one(url: str) -> ScanResult:
+            async with semaphore:
+                context = await self.browser.new_context(storage_state=state, **CONTEXT_OPTIONS)
+                try:
+                    page = await context.new_page()
+                    self.config.apply_timeouts(page)
+                    
+                    shared = SharedBrowser(self.playwright, self.browser, context)
+                    scraper = type(self).from_shared(self.config, shared, page)
+                    # Routed through the per-URL scraper so it captures its own API URLs
+                    await context.route('**/*', scraper._route_filter)
+                    
+                    return await scraper.scan(url, username, password)
+                finally:
+                    await context.close()
+        
+        return await asyncio.gather(*(scan_one(url) for url in urls))
@@ -7,10 +7,12 @@ Part of MultiCourtScore v2
 """
 
 import asyncio
+import logging
 import re
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import List, Optional, Set
 
-from playwright.async_api import TimeoutError as PlaywrightTimeout
+from playwright.async_api import Locator, TimeoutError as PlaywrightTimeout
 
 from .core import (
     VBLScraperBase, 
@@ -20,6 +22,147 @@ from .core import (
     logger
 )
 
+# First sign that the pool's match cards have rendered
+MATCH_CARD_READY_SELECTOR = (
+    'div.v-card:has(.teams-table), div.v-card:has(td.clickable), div.v-sheet:has(.teams-table)'
+)
+
+# Card text parsing
+MATCH_NUM_RE = re.compile(r'Match\s*(\d+)', re.IGNORECASE)
+TEAM_NAMES_RE = re.compile(r'[A-Z][a-z]+\s+[A-Z][a-z]+')
+CLOCK_RE = re.compile(r'\d{1,2}:\d{2}')
+# Valid times: 1:00-12:59 AM/PM, not preceded by another digit
+# (avoids "219:00AM" from scores)
+TIME_RE = re.compile(r'(?<![0-9])((1[0-2]|[1-9]):\d{2}\s*(?:AM|PM))', re.IGNORECASE)
+DAY_PATTERN = r'\b(?P<day>Mon(?:day)?|Tue(?:sday)?|Wed(?:nesday)?|Thu(?:rsday)?|Fri(?:day)?|Sat(?:urday)?|Sun(?:day)?)\b'
+DAY_RE = re.compile(DAY_PATTERN, re.IGNORECASE)
+# A weekday or a date (12/31, 1/1/2026), whichever comes first
+DAY_OR_DATE_RE = re.compile(
+    DAY_PATTERN + r'|\b(?P<date>\d{1,2}/\d{1,2}(?:/\d{2,4})?)\b', re.IGNORECASE
+)
+# "Court 1", "Court A", "Stadium Court"
+COURT_RE = re.compile(r'Court\s*(\d+|[A-Za-z]+(?:\s+Court)?)', re.IGNORECASE)
+COURT_TRAIL_RE = re.compile(r'(?:Team|Set|Match|Score|vs).*$', re.IGNORECASE)
+
+VMIX_TEXT_RE = re.compile(r'vmix', re.IGNORECASE)
+
+# vMix API URLs, in card text and in page HTML after a vMix click
+VMIX_LINK_RE = re.compile(r'(https://api\.volleyballlife\.com[^\s"<]+vmix[^\s"<]*)', re.IGNORECASE)
+# The URL ends at the query string's first quote, bracket or whitespace,
+# so the match needs no trimming
+API_BRACKET_URL_RE = re.compile(
+    r'https://api\.volleyballlife\.com/api/v1\.0/matches/\d+/vmix\?bracket=true', re.IGNORECASE
+)
+API_URL_RE = re.compile(
+    r'https://api\.volleyballlife\.com/api/v1\.0/matches/\d+/vmix(?:\?[^\s"<>]*)?', re.IGNORECASE
+)
+
+# Team names from free text: "A B / C D vs E F / G H", or name-like lines
+TEAMS_VS_RE = re.compile(
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:\s*/\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)?)\s+(?:vs\.?|v\.)\s+'
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:\s*/\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)?)'
+)
+TEAM_LINE_RE = re.compile(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:\s*/\s*[A-Z][a-z]+)?')
+LEADING_DIGIT_RE = re.compile(r'^\d')
+
+# A visible "Sign In" button or a "Please sign in" notice, checked in the
+# page in one round trip
+REQUIRES_LOGIN_JS = """
+() => {
+    const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const signIn = Array.from(document.querySelectorAll('button'))
+        .some(el => visible(el) && (el.textContent || '').toLowerCase().includes('sign in'));
+    return signIn || (document.body.innerText || '').includes('Please sign in');
+}
+"""
+
+# Viewport position of an element in 10px buckets, used as the dedup key
+# for nested containers; truncates like Python's int()
+POSITION_KEY_JS = """\
+    const positionKey = el => {
+        const rect = el.getBoundingClientRect();
+        return [Math.trunc(rect.x / 10), Math.trunc(rect.y / 10)];
+    };
+"""
+
+# Text and position key of each element a locator matches, or null for
+# elements that are not visible
+CANDIDATES_JS = """
+(els) => {
+""" + POSITION_KEY_JS + """\
+    const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    return els.map(el => visible(el) ? {text: el.textContent || '', position: positionKey(el)} : null);
+}
+"""
+
+# Trimmed text of the first two elements a locator matches
+FIRST_TWO_TEXTS_JS = "els => els.slice(0, 2).map(el => (el.textContent || '').trim())"
+
+# Visible v-card match cards with their text, team cells, seed avatars,
+# position key and the index of their first vMix button (-1 if none);
+# index is the card's position among all div.v-card elements
+MATCH_CARDS_JS = """
+() => {
+""" + POSITION_KEY_JS + """\
+    const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const firstTwo = (el, selector) => Array.from(el.querySelectorAll(selector))
+        .slice(0, 2).map(cell => (cell.textContent || '').trim());
+    const cards = [];
+    document.querySelectorAll('div.v-card').forEach((el, index) => {
+        if (!el.querySelector('.teams-table, td.clickable') || !visible(el)) {
+            return;
+        }
+        cards.push({
+            index,
+            text: el.textContent || '',
+            teams: firstTwo(el, 'td.clickable'),
+            seeds: firstTwo(el, '.v-avatar'),
+            position: positionKey(el),
+            vmixButton: Array.from(el.querySelectorAll('button'))
+                .findIndex(btn => (btn.textContent || '').toLowerCase().includes('vmix'))
+        });
+    });
+    return cards;
+}
+"""
+
+
+def looks_like_match(text: str) -> bool:
+    """Card text with a match number, or team-like names plus a clock time"""
+    if MATCH_NUM_RE.search(text):
+        return True
+    return bool(TEAM_NAMES_RE.search(text)) and bool(CLOCK_RE.search(text))
+
+
+def find_api_url(content: str) -> Optional[str]:
+    """First ?bracket=true vMix API URL in content, else the first of any kind"""
+    m = API_BRACKET_URL_RE.search(content) or API_URL_RE.search(content)
+    return m.group(0) if m else None
+
+
+def team_signature(team1: Optional[str], team2: Optional[str]) -> int:
+    """
+    Order-independent 64-bit key for a pairing, so A vs B and B vs A
+    collide. Dedup sets hold these ints instead of the name pairs.
+    """
+    a, b = team1 or "", team2 or ""
+    return hash((a, b) if a <= b else (b, a)) & 0xFFFFFFFFFFFFFFFF
+
+
+def is_vmix_request(request) -> bool:
+    """Network request for a match's vMix API URL"""
+    url = request.url
+    return 'api.volleyballlife.com' in url and '/vmix' in url
+
+
+@dataclass(slots=True)
+class MatchCard:
+    """A match read from the pool page, with what the vMix click phase needs"""
+    container: Locator
+    match: VBLMatch
+    has_vmix: bool = True  # False when the card text never mentions vMix
+    vmix_button: Optional[int] = None  # index among the card's buttons, if known
+
 
 class PoolScraper(VBLScraperBase):
     """
@@ -42,7 +185,7 @@ class PoolScraper(VBLScraperBase):
         result.type_detail = type_detail
         
         try:
-            logger.info(f"Scanning pool: {url}")
+            logger.info("Scanning pool: %s", url)
             await self.page.goto(url, wait_until='networkidle')
             
             # Check for login required (session-level tracking prevents multiple logins)
@@ -64,94 +207,150 @@ class PoolScraper(VBLScraperBase):
                     result.error = "Login required but no credentials provided"
                     return result
             
-            # Wait for content to load (VBL React is slow)
+            # Wait for the first match card to render (VBL React is slow)
             logger.info("Waiting for pool content to load...")
-            await asyncio.sleep(4.0)
+            try:
+                await self.page.wait_for_selector(MATCH_CARD_READY_SELECTOR, timeout=8000)
+            except PlaywrightTimeout:
+                logger.info("No match card rendered yet - reading the page as is")
             
-            # Phase 1: Find match containers
-            containers = await self._find_match_containers()
-            logger.info(f"Found {len(containers)} match containers")
+            # Phase 1: Read all match cards in one evaluate, falling back to
+            # per-container reads for layouts it does not cover
+            cards = await self._bulk_extract_matches()
+            if not cards:
+                cards = await self._read_match_containers()
+            logger.info("Found %d match containers", len(cards))
             
-            if not containers:
+            if not cards:
                 result.status = "success"
                 result.error = "No matches found on page"
                 return result
             
             # Extract match format from page (e.g., "2 sets, both to 21")
             match_format = await self.extract_match_format()
-            logger.info(f"Match format: {match_format.get('format_text', 'Not found')}")
-            
-            # Process each match
-            for i, container in enumerate(containers):
+            logger.info("Match format: %s", match_format.get('format_text', 'Not found'))
+            # Same format for every match on the page
+            sets_to_win = match_format['sets_to_win']
+            points_per_set = match_format['points_per_set']
+            point_cap = match_format['point_cap']
+            format_text = match_format['format_text']
+            
+            # vMix clicks open overlays on the shared page, so cards without
+            # an API URL in their text are clicked one at a time
+            for i, card in enumerate(cards):
+                match = card.match
+                if match.api_url or not card.has_vmix:
+                    continue
                 try:
-                    logger.info(f"Processing match {i+1}/{len(containers)}...")
-                    
-                    match = await self._process_match(container, i)
-                    
-                    if match and (match.team1 or match.api_url):
-                        # Set match type from URL analysis
-                        match.match_type = match_type
-                        match.type_detail = type_detail
-                        # Apply match format
-                        match.sets_to_win = match_format['sets_to_win']
-                        match.points_per_set = match_format['points_per_set']
-                        match.point_cap = match_format['point_cap']
-                        match.format_text = match_format['format_text']
-                        result.matches.append(match)
-                        team_info = f"{match.team1} vs {match.team2}" if match.team1 else f"Match {i+1}"
-                        api_status = "✓ API" if match.api_url else "✗ No API"
-                        court_info = f"Court {match.court}" if match.court else "Court TBD"
-                        time_info = match.start_time if match.start_time else ""
-                        logger.info(f"  [{i+1}] {team_info} - {court_info} {time_info} - {api_status}")
-                    
-                    # Close any overlay and pause
-                    await self._close_overlay()
-                    await asyncio.sleep(0.5)
-                    
+                    match.api_url = await self._click_for_api_url(card)
                 except Exception as e:
-                    logger.warning(f"  [{i+1}] Error: {e}")
+                    logger.warning("  [%d] Error: %s", i+1, e)
+                finally:
                     await self._close_overlay()
-                    continue
+            
+            for i, card in enumerate(cards):
+                match = card.match
+                if match.team1 or match.api_url:
+                    # Set match type from URL analysis
+                    match.match_type = match_type
+                    match.type_detail = type_detail
+                    # Apply match format
+                    match.sets_to_win = sets_to_win
+                    match.points_per_set = points_per_set
+                    match.point_cap = point_cap
+                    match.format_text = format_text
+                    result.matches.append(match)
+                    team_info = f"{match.team1} vs {match.team2}" if match.team1 else f"Match {i+1}"
+                    api_status = "✓ API" if match.api_url else "✗ No API"
+                    court_info = f"Court {match.court}" if match.court else "Court TBD"
+                    time_info = match.start_time if match.start_time else ""
+                    logger.info("  [%d] %s - %s %s - %s", i+1, team_info, court_info, time_info, api_status)
             
             # Deduplicate matches by team signature
             unique_matches = []
-            seen_signatures = set()
+            seen_signatures: Set[int] = set()
             for match in result.matches:
-                # Create a signature based on team names (sorted to handle order differences)
-                teams = sorted([match.team1 or "", match.team2 or ""])
-                signature = f"{teams[0]}|{teams[1]}"
-                
-                if signature not in seen_signatures:
-                    seen_signatures.add(signature)
-                    unique_matches.append(match)
-                else:
-                    logger.debug(f"  Removing duplicate: {match.team1} vs {match.team2}")
+                signature = team_signature(match.team1, match.team2)
+                if signature in seen_signatures:
+                    logger.debug("  Removing duplicate: %s vs %s", match.team1, match.team2)
+                    continue
+                seen_signatures.add(signature)
+                unique_matches.append(match)
             
             result.matches = unique_matches
             # Note: total_matches is a computed property, no need to set it
             result.status = "success"
-            logger.info(f"Pool scan complete: {len(result.matches)} matches extracted (after dedup)")
+            logger.info("Pool scan complete: %d matches extracted (after dedup)", len(result.matches))
             
         except Exception as e:
             result.status = "error"
             result.error = str(e)
-            logger.error(f"Pool scan failed: {e}")
+            logger.error("Pool scan failed: %s", e)
         
         return result
     
     async def _requires_login(self) -> bool:
         """Check if the page requires login"""
+        return await self.page.evaluate(REQUIRES_LOGIN_JS)
+    
+    async def _bulk_extract_matches(self) -> List[MatchCard]:
+        """Read every visible match card with one page evaluate"""
         try:
-            selectors = [
-                'button:has-text("Sign In")',
-                'text="Please sign in"'
-            ]
-            for selector in selectors:
-                if await self.page.is_visible(selector, timeout=2000):
-                    return True
-            return False
-        except PlaywrightTimeout:
-            return False
+            records = await self.page.evaluate(MATCH_CARDS_JS)
+        except Exception as e:
+            logger.debug("Bulk card read failed: %s", e)
+            return []
+        
+        cards = []
+        positions = set()
+        for record in records:
+            text = record['text']
+            if not looks_like_match(text):
+                continue
+            
+            # Deduplicate by position (avoid nested duplicates)
+            pos_key = tuple(record['position'])
+            if pos_key in positions:
+                continue
+            positions.add(pos_key)
+            
+            match = VBLMatch(index=len(cards))
+            teams = record['teams']
+            if len(teams) >= 2:
+                match.team1, match.team2 = teams[0], teams[1]
+            seeds = record['seeds']
+            if len(seeds) >= 2:
+                if seeds[0].isdigit():
+                    match.team1_seed = seeds[0]
+                if seeds[1].isdigit():
+                    match.team2_seed = seeds[1]
+            self._parse_card_text(match, text)
+            
+            vmix_button = record['vmixButton']
+            cards.append(MatchCard(
+                container=self.page.locator('div.v-card').nth(record['index']),
+                match=match,
+                has_vmix='vmix' in text.lower(),
+                vmix_button=vmix_button if vmix_button >= 0 else None,
+            ))
+        
+        logger.info("  Bulk read %d match cards", len(cards))
+        return cards
+    
+    async def _read_match_containers(self) -> List[MatchCard]:
+        """Fallback reader: find containers, then read each one concurrently"""
+        containers = await self._find_match_containers()
+        semaphore = asyncio.Semaphore(self.config.match_concurrency)
+        
+        async def read_card(i: int, container) -> VBLMatch:
+            async with semaphore:
+                logger.info("Processing match %d/%d...", i+1, len(containers))
+                return await self._process_match_fast(container, i)
+        
+        matches = await asyncio.gather(
+            *(read_card(i, container) for i, container in enumerate(containers))
+        )
+        return [MatchCard(container, match) for container, match in zip(containers, matches)]
     
     async def _find_match_containers(self) -> List:
         """Find all match card containers on the pool page"""
@@ -168,218 +367,211 @@ class PoolScraper(VBLScraperBase):
             'div.v-card',                             # Any Vuetify card
         ]
         
-        containers = []
-        
+        # One evaluate per selector returns every candidate's visibility, text
+        # and position; the first selector with a match-like card wins
+        unique_containers = []
         for selector in selectors:
             try:
-                elements = await self.page.locator(selector).all()
-                logger.info(f"  Trying '{selector}': found {len(elements)} elements")
-                
-                if elements:
-                    for el in elements:
-                        try:
-                            if not await el.is_visible():
-                                continue
-                            
-                            # Check if it looks like a match card (has match number or team names)
-                            text = await el.text_content() or ""
-                            has_match_marker = bool(re.search(r'Match\s*\d+', text, re.I))
-                            has_team_names = bool(re.search(r'[A-Z][a-z]+\s+[A-Z][a-z]+', text))
-                            has_time = bool(re.search(r'\d{1,2}:\d{2}', text))
-                            
-                            if has_match_marker or (has_team_names and has_time):
-                                containers.append(el)
-                                logger.debug(f"    Added container with text: {text[:50]}...")
-                        except Exception as e:
-                            logger.debug(f"    Error checking element: {e}")
-                            continue
-                    
-                    if containers:
-                        logger.info(f"  Found {len(containers)} valid match containers")
-                        break
-                        
+                locator = self.page.locator(selector)
+                candidates = await locator.evaluate_all(CANDIDATES_JS)
+                logger.info("  Trying '%s': found %d elements", selector, len(candidates))
             except Exception as e:
-                logger.debug(f"  Selector '{selector}' error: {e}")
+                logger.debug("  Selector '%s' error: %s", selector, e)
                 continue
+            
+            positions = set()
+            found = 0
+            for index, candidate in enumerate(candidates):
+                # Check if it looks like a match card (has match number or team names)
+                if candidate is None or not looks_like_match(candidate['text']):
+                    continue
+                found += 1
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("    Added container with text: %s...", candidate['text'][:50])
+                
+                # Deduplicate by position (avoid nested duplicates)
+                pos_key = tuple(candidate['position'])
+                if pos_key not in positions:
+                    positions.add(pos_key)
+                    unique_containers.append(locator.nth(index))
+            
+            if found:
+                logger.info("  Found %d valid match containers", found)
+                break
         
-        # Deduplicate by position (avoid nested duplicates)
-        unique_containers = []
-        positions = set()
-        for el in containers:
-            try:
-                box = await el.bounding_box()
-                if box:
-                    # Round to avoid float precision issues
-                    pos_key = (int(box['x'] / 10), int(box['y'] / 10))
-                    if pos_key not in positions:
-                        positions.add(pos_key)
-                        unique_containers.append(el)
-            except Exception:
-                unique_containers.append(el)
-        
-        logger.info(f"  Returning {len(unique_containers)} unique containers")
+        logger.info("  Returning %d unique containers", len(unique_containers))
         return unique_containers
     
-    async def _process_match(self, container, index: int) -> Optional[VBLMatch]:
-        """Process a single match container - extract data and API URL"""
+    async def _process_match_fast(self, container, index: int) -> VBLMatch:
+        """
+        Read a single match container without clicking anything, so cards
+        can be processed concurrently. The API URL is only taken from the
+        card text here; see _click_for_api_url for the rest.
+        """
         match = VBLMatch(index=index)
         
         try:
             # Get full text content for regex extraction
             text = await container.text_content() or ""
-            logger.debug(f"  Container text: {text[:100]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("  Container text: %s...", text[:100])
             
             # Extract team names from clickable cells within the card
             try:
-                name_cells = await container.locator('td.clickable').all()
-                if len(name_cells) >= 2:
-                    match.team1 = (await name_cells[0].text_content() or "").strip()
-                    match.team2 = (await name_cells[1].text_content() or "").strip()
-                    logger.info(f"    Teams: {match.team1} vs {match.team2}")
+                names = await container.locator('td.clickable').evaluate_all(FIRST_TWO_TEXTS_JS)
+                if len(names) >= 2:
+                    match.team1, match.team2 = names
+                    logger.info("    Teams: %s vs %s", match.team1, match.team2)
             except Exception:
                 # Fallback to text extraction
                 team1, team2 = self._extract_teams(text)
                 match.team1 = team1
                 match.team2 = team2
             
-            # Extract match number - VBL format: "Match 1", "Match 2", etc.
-            match_num = re.search(r'Match\s*(\d+)', text, re.I)
-            if match_num:
-                match.match_number = match_num.group(1)
-                logger.info(f"    Match #: {match.match_number}")
-            
-            # Extract time - VBL format: "8:00AM", "11:00AM" etc.
-            # Use lookbehind to ensure time isn't preceded by another digit (avoids "219:00AM" from scores)
-            # Valid times: 1:00-12:59 AM/PM
-            time_match = re.search(r'(?<![0-9])((1[0-2]|[1-9]):\d{2}\s*(?:AM|PM))', text, re.I)
-            if time_match:
-                match.start_time = time_match.group(1).strip()
-                logger.info(f"    Time: {match.start_time}")
-            else:
-                logger.debug(f"    No time found in text")
-            
-            # Extract day of week - VBL may show "Thu", "Friday", etc.
-            day_patterns = [
-                r'\b(Mon(?:day)?|Tue(?:sday)?|Wed(?:nesday)?|Thu(?:rsday)?|Fri(?:day)?|Sat(?:urday)?|Sun(?:day)?)\b',
-                r'\b(\d{1,2}/\d{1,2}(?:/\d{2,4})?)\b',  # Date format: 12/31, 1/1/2026
-            ]
-            for pattern in day_patterns:
-                day_match = re.search(pattern, text, re.I)
-                if day_match:
-                    match.start_date = day_match.group(1)
-                    logger.info(f"    Date: {match.start_date}")
-                    break
-            
-            # Extract court - VBL formats: "Court 1", "Court A", "Court Stadium", "Center Court", etc.
-            # Stop at boundaries like Team, Set, Match, numbers after letters
-            court_match = re.search(
-                r'Court\s*(\d+|[A-Za-z]+(?:\s+Court)?)',  # "Court 1", "Court A", "Stadium Court"  
-                text, 
-                re.I
-            )
-            if court_match:
-                court_val = court_match.group(1).strip()
-                # Clean up: remove trailing words that aren't part of court name
-                court_val = re.sub(r'(?:Team|Set|Match|Score|vs).*$', '', court_val, flags=re.I).strip()
-                match.court = court_val
-                logger.info(f"    Court: {match.court}")
-            
             # Extract seed from avatar/badge within the card
             try:
-                seed_cells = await container.locator('.v-avatar').all()
-                if len(seed_cells) >= 2:
-                    seed1 = (await seed_cells[0].text_content() or "").strip()
-                    seed2 = (await seed_cells[1].text_content() or "").strip()
+                seeds = await container.locator('.v-avatar').evaluate_all(FIRST_TWO_TEXTS_JS)
+                if len(seeds) >= 2:
+                    seed1, seed2 = seeds
                     if seed1.isdigit():
                         match.team1_seed = seed1
                     if seed2.isdigit():
                         match.team2_seed = seed2
-                    logger.debug(f"    Seeds: {seed1}, {seed2}")
+                    logger.debug("    Seeds: %s, %s", seed1, seed2)
             except Exception:
                 pass
             
-            # Try to get API URL from vMix button
-            # First look for button in the container
-            api_url = await self._extract_api_url_from_container(container)
-            
-            if not api_url:
-                # Look for vMix link/button anywhere in card text (V3 shows it as text link)
-                vmix_link = re.search(r'(https://api\.volleyballlife\.com[^\s"<]+vmix[^\s"<]*)', text, re.I)
-                if vmix_link:
-                    api_url = vmix_link.group(1)
-                    logger.info(f"    API URL (from text): {api_url}")
-            
-            if not api_url:
-                # Click the vMix button/text in the container
-                try:
-                    vmix_element = container.locator('text=VMix, text=vMix, text=VMIX').first
-                    if await vmix_element.is_visible(timeout=1000):
-                        await vmix_element.click(force=True)
-                        await asyncio.sleep(1.0)
-                        
-                        # Look for URL in page content after click
-                        content = await self.page.content()
-                        api_patterns = [
-                            r'(https://api\.volleyballlife\.com/api/v1\.0/matches/\d+/vmix\?bracket=true)',
-                            r'(https://api\.volleyballlife\.com/api/v1\.0/matches/\d+/vmix[^"\s<]*)',
-                        ]
-                        for pattern in api_patterns:
-                            matches = re.findall(pattern, content, re.I)
-                            if matches:
-                                api_url = matches[0].split()[0].split('<')[0].strip()
-                                logger.info(f"    API URL (after click): {api_url}")
-                                break
-                except Exception as e:
-                    logger.debug(f"    vMix click failed: {e}")
-            
-            if api_url:
-                match.api_url = api_url
+            self._parse_card_text(match, text)
                 
         except Exception as e:
-            logger.debug(f"Error processing match container: {e}")
+            logger.debug("Error processing match container: %s", e)
         
         return match
     
-    async def _extract_api_url_from_container(self, container) -> Optional[str]:
-        """Try to extract API URL directly from a match card container"""
+    def _parse_card_text(self, match: VBLMatch, text: str) -> None:
+        """Fill match number, time, date, court and any in-text API URL from card text"""
+        # Extract match number - VBL format: "Match 1", "Match 2", etc.
+        match_num = MATCH_NUM_RE.search(text)
+        if match_num:
+            match.match_number = match_num.group(1)
+            logger.info("    Match #: %s", match.match_number)
+        
+        # Extract time - VBL format: "8:00AM", "11:00AM" etc.
+        time_match = TIME_RE.search(text)
+        if time_match:
+            match.start_time = time_match.group(1).strip()
+            logger.info("    Time: %s", match.start_time)
+        else:
+            logger.debug("    No time found in text")
+        
+        # Extract day of week - VBL may show "Thu", "Friday", etc.; a
+        # weekday anywhere wins over a date, so only a date hit needs a
+        # second look at the rest of the text
+        day_match = DAY_OR_DATE_RE.search(text)
+        if day_match:
+            start_date = day_match.group('day')
+            if not start_date:
+                later_day = DAY_RE.search(text, day_match.end())
+                start_date = later_day.group('day') if later_day else day_match.group('date')
+            match.start_date = start_date
+            logger.info("    Date: %s", match.start_date)
+        
+        # Extract court - VBL formats: "Court 1", "Court A", "Court Stadium", "Center Court", etc.
+        # Stop at boundaries like Team, Set, Match, numbers after letters
+        court_match = COURT_RE.search(text)
+        if court_match:
+            court_val = court_match.group(1)
+            # Clean up: remove trailing words that aren't part of court name;
+            # numeric courts ("Court 1") never contain one
+            if not court_val.isdigit():
+                court_val = COURT_TRAIL_RE.sub('', court_val)
+            match.court = court_val
+            logger.info("    Court: %s", match.court)
+        
+        # Look for vMix link anywhere in card text (V3 shows it as text link)
+        vmix_link = VMIX_LINK_RE.search(text)
+        if vmix_link:
+            match.api_url = vmix_link.group(1)
+            logger.info("    API URL (from text): %s", match.api_url)
+    
+    async def _click_for_api_url(self, card: MatchCard) -> Optional[str]:
+        """Click a card's vMix button (or vMix text) and read the API URL"""
+        container = card.container
+        # First look for button in the container
+        api_url = await self._extract_api_url_from_container(container, card.vmix_button)
+        
+        if not api_url:
+            # Click the vMix button/text in the container
+            try:
+                vmix_element = container.locator('text=VMix, text=vMix, text=VMIX').first
+                if await vmix_element.is_visible(timeout=1000):
+                    api_url = await self._click_and_capture(vmix_element)
+                    if api_url:
+                        logger.info("    API URL (requested after click): %s", api_url)
+                        return api_url
+                    
+                    # Look for URL in page content after click
+                    api_url = find_api_url(await self.page.content())
+                    if api_url:
+                        logger.info("    API URL (after click): %s", api_url)
+            except Exception as e:
+                logger.debug("    vMix click failed: %s", e)
+        
+        return api_url
+    
+    async def _click_and_capture(self, element) -> Optional[str]:
+        """
+        Click a vMix control and return the API URL the page requests in
+        response, waiting up to 1 s. Returns None if no such request is
+        seen; callers then fall back to searching the page HTML.
+        """
+        try:
+            async with self.page.expect_request(is_vmix_request, timeout=1000) as request_info:
+                await element.click(force=True)
+            return (await request_info.value).url
+        except PlaywrightTimeout:
+            return None
+    
+    async def _extract_api_url_from_container(
+        self, container, button_index: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Try to extract API URL directly from a match card container.
+        button_index, when the bulk read found it, addresses the vMix
+        button directly instead of matching every button's text.
+        """
         try:
             # Look for vMix button within this container
-            vmix_btn = container.locator('button:has-text("VMIX"), button:has-text("vMix")').first
+            buttons = container.locator('button')
+            if button_index is not None:
+                vmix_btn = buttons.nth(button_index)
+            else:
+                vmix_btn = buttons.filter(has_text=VMIX_TEXT_RE).first
             
             if await vmix_btn.is_visible():
-                await vmix_btn.click(force=True)
-                await asyncio.sleep(1.0)
+                url = await self._click_and_capture(vmix_btn)
+                if url:
+                    logger.debug("    Found API URL (requested): %s", url)
+                    return url
                 
                 # Look for API URL in page content
-                content = await self.page.content()
-                api_patterns = [
-                    r'(https://api\.volleyballlife\.com/api/v1\.0/matches/\d+/vmix\?bracket=true)',
-                    r'(https://api\.volleyballlife\.com/api/v1\.0/matches/\d+/vmix[^"\s<]+)',
-                ]
-                
-                for pattern in api_patterns:
-                    matches = re.findall(pattern, content, re.I)
-                    if matches:
-                        url = matches[0].split()[0].split('<')[0].strip()
-                        logger.debug(f"    Found API URL: {url}")
-                        return url
+                url = find_api_url(await self.page.content())
+                if url:
+                    logger.debug("    Found API URL: %s", url)
+                    return url
             
             return None
             
         except Exception as e:
-            logger.debug(f"Error extracting API from container: {e}")
+            logger.debug("Error extracting API from container: %s", e)
             return None
     
     def _extract_teams(self, text: str) -> tuple:
         """Extract team names from text"""
         team1, team2 = None, None
         
-        # Pattern: "FirstName LastName / FirstName LastName"
-        team_pattern = r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s*/\s*[A-Z][a-z]+\s+[A-Z][a-z]+)?)'
-        
         # Look for "vs" pattern
-        vs_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:\s*/\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)?)\s+(?:vs\.?|v\.)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:\s*/\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)?)'
-        m = re.search(vs_pattern, text)
+        m = TEAMS_VS_RE.search(text)
         if m:
             team1 = self.clean_team_name(m.group(1))
             team2 = self.clean_team_name(m.group(2))
@@ -389,9 +581,9 @@ class PoolScraper(VBLScraperBase):
         lines = [l.strip() for l in text.split('\n') if l.strip()]
         name_lines = []
         for line in lines:
-            if re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:\s*/\s*[A-Z][a-z]+)?', line):
+            if TEAM_LINE_RE.match(line):
                 # Skip if it's just a time or match number
-                if not re.match(r'^\d', line) and 'Match' not in line:
+                if not LEADING_DIGIT_RE.match(line) and 'Match' not in line:
                     name_lines.append(line)
         
         if len(name_lines) >= 2:
@@ -430,23 +622,23 @@ class PoolScraper(VBLScraperBase):
             
             # Extract team names if not found
             if not match.team1:
-                name_cells = await overlay.locator('td.clickable').all()
-                if len(name_cells) >= 2:
-                    match.team1 = (await name_cells[0].text_content() or "").strip()
-                    match.team2 = (await name_cells[1].text_content() or "").strip()
+                names = await overlay.locator('td.clickable').evaluate_all(FIRST_TWO_TEXTS_JS)
+                if len(names) >= 2:
+                    match.team1, match.team2 = names
             
             # Extract seeds
-            seed_cells = await overlay.locator('td.d-flex.align-center.justify-center').all()
-            if len(seed_cells) >= 2:
-                seed1 = (await seed_cells[0].text_content() or "").strip()
-                seed2 = (await seed_cells[1].text_content() or "").strip()
+            seeds = await overlay.locator('td.d-flex.align-center.justify-center').evaluate_all(
+                FIRST_TWO_TEXTS_JS
+            )
+            if len(seeds) >= 2:
+                seed1, seed2 = seeds
                 if seed1.isdigit():
                     match.team1_seed = seed1
                 if seed2.isdigit():
                     match.team2_seed = seed2
                     
         except Exception as e:
-            logger.debug(f"Error extracting overlay data: {e}")
+            logger.debug("Error extracting overlay data: %s", e)
     
     async def _extract_api_url(self) -> Optional[str]:
         """Click vMix button and extract API URL"""
@@ -459,6 +651,7 @@ class PoolScraper(VBLScraperBase):
             ]
             
             vmix_clicked = False
+            requested = None
             for selector in vmix_selectors:
                 try:
                     buttons = await self.page.locator(selector).all()
@@ -466,7 +659,7 @@ class PoolScraper(VBLScraperBase):
                         if await btn.is_visible() and await btn.is_enabled():
                             text = await btn.text_content() or ""
                             if 'vmix' in text.lower():
-                                await btn.click(force=True)
+                                requested = await self._click_and_capture(btn)
                                 vmix_clicked = True
                                 break
                     if vmix_clicked:
@@ -477,22 +670,13 @@ class PoolScraper(VBLScraperBase):
             if not vmix_clicked:
                 logger.debug("vMix button not found")
                 return None
-            
-            # Wait for API URL to appear
-            await asyncio.sleep(1.0)
+            if requested:
+                return requested
             
             # Look for API URL in page content
-            content = await self.page.content()
-            api_patterns = [
-                r'(https://api\.volleyballlife\.com/api/v1\.0/matches/\d+/vmix\?bracket=true)',
-                r'(https://api\.volleyballlife\.com/api/v1\.0/matches/\d+/vmix[^"\s<]+)',
-            ]
-            
-            for pattern in api_patterns:
-                matches = re.findall(pattern, content, re.I)
-                if matches:
-                    url = matches[0].split()[0].split('<')[0].strip()
-                    return url
+            url = find_api_url(await self.page.content())
+            if url:
+                return url
             
             # Look for links
             links = await self.page.locator('a[href*="api.volleyballlife.com"]').all()
@@ -505,7 +689,7 @@ class PoolScraper(VBLScraperBase):
             return None
             
         except Exception as e:
-            logger.debug(f"Error extracting API URL: {e}")
+            logger.debug("Error extracting API URL: %s", e)
             return None
     
     async def _close_overlay(self):
@@ -518,14 +702,21 @@ class PoolScraper(VBLScraperBase):
                     box = await scrim.bounding_box()
                     if box:
                         await self.page.mouse.click(box['x'] + 10, box['y'] + 10)
-                        await asyncio.sleep(0.2)
+                        await self._wait_overlay_hidden()
                         return
             except Exception:
                 pass
             
             # Fallback: press Escape
             await self.page.keyboard.press('Escape')
-            await asyncio.sleep(0.3)
+            await self._wait_overlay_hidden()
             
         except Exception:
             pass
+    
+    async def _wait_overlay_hidden(self):
+        """Return once the overlay scrim is gone, or after 500 ms"""
+        try:
+            await self.page.wait_for_selector('.v-overlay__scrim', state='hidden', timeout=500)
+        except PlaywrightTimeout:
+            pass
@@ -6,7 +6,6 @@ Extracts team seed rankings from the Teams tab of a VBL division
 Part of MultiCourtScore v2
 """
 
-import asyncio
 import re
 from typing import Dict, Optional
 
@@ -19,6 +18,44 @@ from .core import (
 )
 
 
+# Event/division prefix of any URL inside a division
+DIVISION_URL_RE = re.compile(r'(https?://[^/]+)?/event/(\d+)/division/(\d+)')
+
+# "1. FirstName LastName / FirstName LastName" lines in the page text
+SEED_LINE_RE = re.compile(
+    r'(\d{1,2})\.\s*([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s*/\s*[A-Z][a-z]+\s+[A-Z][a-z]+)?)'
+)
+
+# Suffixes stripped from team names: records like "(1-2)" and ranks like "[3]"
+PAREN_SUFFIX_RE = re.compile(r'\s*\([^)]*\)\s*')
+RANK_SUFFIX_RE = re.compile(r'\s*\[\d+\]\s*')
+
+# Any visible header Sign In button means the session is logged out
+SIGN_IN_VISIBLE_SELECTOR = 'button:has-text("Sign In"):visible'
+
+# First Teams table row with both a seed and a name cell
+TEAMS_ROW_READY_SELECTOR = (
+    'table.v-data-table tr:has(td + td), div.v-data-table tr:has(td + td), '
+    'table[class*="team"] tr:has(td + td)'
+)
+
+# Teams table candidates, most specific first
+TEAM_TABLE_SELECTORS = (
+    'table.v-data-table',
+    'div.v-data-table',
+    'table[class*="team"]',
+)
+
+# [seed, name] text of the first two cells of every row that has them,
+# read in the page in one round trip
+TEAM_ROWS_JS = """
+rows => rows
+    .map(row => row.querySelectorAll('td'))
+    .filter(cells => cells.length >= 2)
+    .map(cells => [(cells[0].textContent || '').trim(), (cells[1].textContent || '').trim()])
+"""
+
+
 class TeamsScraper(VBLScraperBase):
     """
     Scraper for VolleyballLife Teams tab.
@@ -58,8 +95,11 @@ class TeamsScraper(VBLScraperBase):
                         logger.error("Login failed")
                         return seeds
             
-            # Wait for content
-            await asyncio.sleep(3.0)
+            # Wait for the first team row instead of a fixed delay
+            try:
+                await self.page.wait_for_selector(TEAMS_ROW_READY_SELECTOR, timeout=8000)
+            except PlaywrightTimeout:
+                logger.info("No team rows rendered - falling back to page text")
             
             # Extract seeds from Teams table
             seeds = await self._extract_seeds()
@@ -74,55 +114,32 @@ class TeamsScraper(VBLScraperBase):
     async def _requires_login(self) -> bool:
         """Check if login is needed"""
         try:
-            return await self.page.is_visible('button:has-text("Sign In")', timeout=2000)
-        except PlaywrightTimeout:
+            return await self.page.locator(SIGN_IN_VISIBLE_SELECTOR).count() > 0
+        except Exception:
             return False
     
     async def _extract_seeds(self) -> Dict[str, str]:
         """Extract team seeds from the Teams table"""
         seeds = {}
         
-        # Common selectors for VBL Teams table
-        table_selectors = [
-            'table.v-data-table',
-            'div.v-data-table',
-            'table[class*="team"]',
-        ]
-        
-        for selector in table_selectors:
+        for selector in TEAM_TABLE_SELECTORS:
             try:
                 table = self.page.locator(selector).first
                 if not await table.is_visible():
                     continue
                 
-                # Find all rows
-                rows = await table.locator('tr').all()
-                logger.info(f"Found {len(rows)} table rows")
+                # First column is usually seed/rank, second the team name
+                rows = await table.locator('tr').evaluate_all(TEAM_ROWS_JS)
+                logger.info(f"Found {len(rows)} team rows")
                 
-                for row in rows:
-                    try:
-                        # Get all cells
-                        cells = await row.locator('td').all()
-                        if len(cells) < 2:
-                            continue
-                        
-                        # First column is usually seed/rank
-                        seed_text = (await cells[0].text_content() or "").strip()
-                        
-                        # Second column is usually team name
-                        name_text = (await cells[1].text_content() or "").strip()
-                        
-                        # Validate seed (should be a number)
-                        if seed_text.isdigit() and name_text:
-                            # Clean team name (remove rankings, records, etc.)
-                            clean_name = self._normalize_team_name(name_text)
-                            if clean_name:
-                                seeds[clean_name] = seed_text
-                                logger.debug(f"  Seed {seed_text}: {clean_name}")
-                                
-                    except Exception as e:
-                        logger.debug(f"Row extraction error: {e}")
-                        continue
+                for seed_text, name_text in rows:
+                    # Validate seed (should be a number)
+                    if seed_text.isdigit() and name_text:
+                        # Clean team name (remove rankings, records, etc.)
+                        clean_name = self._normalize_team_name(name_text)
+                        if clean_name:
+                            seeds[clean_name] = seed_text
+                            logger.debug(f"  Seed {seed_text}: {clean_name}")
                 
                 if seeds:
                     break
@@ -144,10 +161,7 @@ class TeamsScraper(VBLScraperBase):
         try:
             body_text = await self.page.inner_text('body')
             
-            # Pattern: "1. FirstName LastName / FirstName LastName" or similar
-            pattern = r'(\d{1,2})\.\s*([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s*/\s*[A-Z][a-z]+\s+[A-Z][a-z]+)?)'
-            
-            for match in re.finditer(pattern, body_text):
+            for match in SEED_LINE_RE.finditer(body_text):
                 seed = match.group(1)
                 name = self._normalize_team_name(match.group(2))
                 if name:
@@ -163,8 +177,8 @@ class TeamsScraper(VBLScraperBase):
         # Remove extra whitespace
         name = ' '.join(name.split())
         # Remove common suffixes like (1-2), rankings, etc.
-        name = re.sub(r'\s*\([^)]*\)\s*', ' ', name)
-        name = re.sub(r'\s*\[\d+\]\s*', '', name)
+        name = PAREN_SUFFIX_RE.sub(' ', name)
+        name = RANK_SUFFIX_RE.sub('', name)
         return name.strip()
 
 
@@ -175,9 +189,7 @@ def derive_teams_url(pool_url: str) -> Optional[str]:
     e.g., /event/27644/division/104314/round/228002/pools/277767
        -> /event/27644/division/104314/teams
     """
-    # Pattern to extract event and division IDs
-    pattern = r'(https?://[^/]+)?/event/(\d+)/division/(\d+)'
-    match = re.search(pattern, pool_url)
+    match = DIVISION_URL_RE.search(pool_url)
     
     if match:
         base = match.group(1) or 'https://volleyballlife.com'